@@ -0,0 +1,66 @@
+'''
+Compiles the generated contracts into crytic-compile standard exports, which slither loads without invoking solc.
+The sources and exports are committed, this only has to be run again when the generator changes. Needs solc 0.8.x,
+the committed fixtures were built with the stand-in tests/fake-solc, which compiles the subset of Solidity the generator writes.
+
+Usage: python3 -m benchmarks.build_fixtures [solc binary]
+'''
+import os
+import sys
+import json
+from crytic_compile import CryticCompile
+from crytic_compile.platform.standard import generate_standard_export
+from benchmarks.generator import fixture_name, generate_contract, parameter_grid
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+def fixture_path(parameters: dict) -> str:
+    # crytic-compile recognizes standard exports by the _export.json suffix
+    return os.path.join(FIXTURES_DIR, f'{fixture_name(parameters)}_export.json')
+
+# compiles source, a file of directory, into a standard export that references it by its relative path only
+# slither reads the source from the path in the export, so exports are loaded from directory and can be committed
+def standard_export(directory: str, source: str, solc: str) -> dict:
+    cwd = os.getcwd()
+    os.chdir(directory)
+
+    try:
+        export = generate_standard_export(CryticCompile(source, solc=solc))
+    finally:
+        os.chdir(cwd)
+
+    export['working_dir'] = '.'
+
+    for compilation_unit in export['compilation_units'].values():
+        for filename in compilation_unit['filenames']:
+            filename['absolute'] = filename['relative']
+
+        for source_unit in compilation_unit['source_units'].values():
+            for contract in source_unit['contracts'].values():
+                contract['filenames']['absolute'] = contract['filenames']['relative']
+
+    return export
+
+def build_fixture(parameters: dict, solc: str):
+    # the source is kept next to the export
+    source = f'{fixture_name(parameters)}.sol'
+
+    with open(os.path.join(FIXTURES_DIR, source), 'w') as f:
+        f.write(generate_contract(**parameters))
+
+    with open(fixture_path(parameters), 'w') as f:
+        json.dump(standard_export(FIXTURES_DIR, source, solc), f)
+
+def main(solc: str):
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+
+    # compilation runs in FIXTURES_DIR
+    if os.sep in solc:
+        solc = os.path.abspath(solc)
+
+    for parameters in parameter_grid():
+        build_fixture(parameters, solc)
+        print(fixture_path(parameters))
+
+if __name__ == '__main__':
+    main(sys.argv[1] if len(sys.argv) > 1 else 'solc')
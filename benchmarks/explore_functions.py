@@ -0,0 +1,69 @@
+'''
+Times explore_functions on synthetic internal-call chains.
+
+Usage: python3 -m benchmarks.explore_functions
+'''
+import time
+from slither.core.declarations.function_contract import FunctionContract
+from slither.core.expressions.expression import Expression
+from plugin.detectors.utils.all_expression_helpers import explore_functions
+
+EXPRESSIONS_PER_FUNCTION = 5
+
+def make_function(callees: list[FunctionContract]) -> FunctionContract:
+    function = FunctionContract(None)
+    function._expressions = [Expression() for _ in range(EXPRESSIONS_PER_FUNCTION)]
+    function._internal_calls = list(callees)
+
+    return function
+
+# f0 -> f1 -> ... -> f(depth-1)
+def make_chain(depth: int) -> list[FunctionContract]:
+    chain = [make_function([])]
+
+    for _ in range(depth - 1):
+        chain.append(make_function([chain[-1]]))
+
+    chain.reverse()
+    return chain
+
+def bench_chain(depth: int):
+    chain = make_chain(depth)
+
+    start = time.perf_counter()
+    expressions = explore_functions(chain[0], {})
+    elapsed = time.perf_counter() - start
+
+    assert len(expressions) == depth * EXPRESSIONS_PER_FUNCTION
+
+    return elapsed
+
+# roots functions that all call the head of one shared chain, explored with a shared memo
+def bench_shared_callees(roots: int, depth: int):
+    chain = make_chain(depth)
+    functions = [make_function([chain[0]]) for _ in range(roots)]
+    closures = {}
+
+    start = time.perf_counter()
+    for function in functions:
+        explore_functions(function, closures)
+    elapsed = time.perf_counter() - start
+
+    return elapsed
+
+def main():
+    print('Deep internal-call chain')
+    print(f'{"depth":>8} {"seconds":>10} {"us/function":>12}')
+    for depth in (500, 1000, 2000, 4000, 8000, 16000):
+        elapsed = bench_chain(depth)
+        print(f'{depth:>8} {elapsed:>10.4f} {elapsed / depth * 1e6:>12.2f}')
+
+    print()
+    print('Roots sharing one callee chain of depth 1000')
+    print(f'{"roots":>8} {"seconds":>10} {"us/root":>12}')
+    for roots in (10, 100, 1000):
+        elapsed = bench_shared_callees(roots, 1000)
+        print(f'{roots:>8} {elapsed:>10.4f} {elapsed / roots * 1e6:>12.2f}')
+
+if __name__ == '__main__':
+    main()
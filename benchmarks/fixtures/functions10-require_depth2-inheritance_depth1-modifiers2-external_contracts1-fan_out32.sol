@@ -0,0 +1,689 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+contract External0 {
+    function query(uint256 x) external returns (uint256) {
+        return x + 0;
+    }
+}
+
+contract Base0 {
+    uint256 internal base0;
+
+    function setBase0(uint256 value) public virtual {
+        require(value > base0);
+        base0 = value;
+    }
+}
+
+contract Benchmark is Base0 {
+    address internal owner;
+    bool internal stopped;
+    uint256 internal total;
+    External0 internal external0;
+
+    constructor() {
+        owner = msg.sender;
+    }
+
+    modifier guard0() {
+        require(!stopped);
+        _;
+    }
+
+    modifier guard1() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    function helper0(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper1(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper2(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper3(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper4(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper5(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper6(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper7(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper8(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper9(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper10(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper11(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper12(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper13(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper14(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper15(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper16(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper17(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper18(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper19(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper20(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper21(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper22(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper23(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper24(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper25(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper26(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper27(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper28(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper29(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper30(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper31(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function f0(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper0(a);
+        helper1(a);
+        helper2(a);
+        helper3(a);
+        helper4(a);
+        helper5(a);
+        helper6(a);
+        helper7(a);
+        helper8(a);
+        helper9(a);
+        helper10(a);
+        helper11(a);
+        helper12(a);
+        helper13(a);
+        helper14(a);
+        helper15(a);
+        helper16(a);
+        helper17(a);
+        helper18(a);
+        helper19(a);
+        helper20(a);
+        helper21(a);
+        helper22(a);
+        helper23(a);
+        helper24(a);
+        helper25(a);
+        helper26(a);
+        helper27(a);
+        helper28(a);
+        helper29(a);
+        helper30(a);
+        helper31(a);
+        total += external0.query(a);
+    }
+
+    function f1(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper1(a);
+        helper2(a);
+        helper3(a);
+        helper4(a);
+        helper5(a);
+        helper6(a);
+        helper7(a);
+        helper8(a);
+        helper9(a);
+        helper10(a);
+        helper11(a);
+        helper12(a);
+        helper13(a);
+        helper14(a);
+        helper15(a);
+        helper16(a);
+        helper17(a);
+        helper18(a);
+        helper19(a);
+        helper20(a);
+        helper21(a);
+        helper22(a);
+        helper23(a);
+        helper24(a);
+        helper25(a);
+        helper26(a);
+        helper27(a);
+        helper28(a);
+        helper29(a);
+        helper30(a);
+        helper31(a);
+        helper0(a);
+        total += external0.query(a);
+    }
+
+    function f2(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper2(a);
+        helper3(a);
+        helper4(a);
+        helper5(a);
+        helper6(a);
+        helper7(a);
+        helper8(a);
+        helper9(a);
+        helper10(a);
+        helper11(a);
+        helper12(a);
+        helper13(a);
+        helper14(a);
+        helper15(a);
+        helper16(a);
+        helper17(a);
+        helper18(a);
+        helper19(a);
+        helper20(a);
+        helper21(a);
+        helper22(a);
+        helper23(a);
+        helper24(a);
+        helper25(a);
+        helper26(a);
+        helper27(a);
+        helper28(a);
+        helper29(a);
+        helper30(a);
+        helper31(a);
+        helper0(a);
+        helper1(a);
+        total += external0.query(a);
+    }
+
+    function f3(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper3(a);
+        helper4(a);
+        helper5(a);
+        helper6(a);
+        helper7(a);
+        helper8(a);
+        helper9(a);
+        helper10(a);
+        helper11(a);
+        helper12(a);
+        helper13(a);
+        helper14(a);
+        helper15(a);
+        helper16(a);
+        helper17(a);
+        helper18(a);
+        helper19(a);
+        helper20(a);
+        helper21(a);
+        helper22(a);
+        helper23(a);
+        helper24(a);
+        helper25(a);
+        helper26(a);
+        helper27(a);
+        helper28(a);
+        helper29(a);
+        helper30(a);
+        helper31(a);
+        helper0(a);
+        helper1(a);
+        helper2(a);
+        total += external0.query(a);
+    }
+
+    function f4(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper4(a);
+        helper5(a);
+        helper6(a);
+        helper7(a);
+        helper8(a);
+        helper9(a);
+        helper10(a);
+        helper11(a);
+        helper12(a);
+        helper13(a);
+        helper14(a);
+        helper15(a);
+        helper16(a);
+        helper17(a);
+        helper18(a);
+        helper19(a);
+        helper20(a);
+        helper21(a);
+        helper22(a);
+        helper23(a);
+        helper24(a);
+        helper25(a);
+        helper26(a);
+        helper27(a);
+        helper28(a);
+        helper29(a);
+        helper30(a);
+        helper31(a);
+        helper0(a);
+        helper1(a);
+        helper2(a);
+        helper3(a);
+        total += external0.query(a);
+    }
+
+    function f5(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper5(a);
+        helper6(a);
+        helper7(a);
+        helper8(a);
+        helper9(a);
+        helper10(a);
+        helper11(a);
+        helper12(a);
+        helper13(a);
+        helper14(a);
+        helper15(a);
+        helper16(a);
+        helper17(a);
+        helper18(a);
+        helper19(a);
+        helper20(a);
+        helper21(a);
+        helper22(a);
+        helper23(a);
+        helper24(a);
+        helper25(a);
+        helper26(a);
+        helper27(a);
+        helper28(a);
+        helper29(a);
+        helper30(a);
+        helper31(a);
+        helper0(a);
+        helper1(a);
+        helper2(a);
+        helper3(a);
+        helper4(a);
+        total += external0.query(a);
+    }
+
+    function f6(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper6(a);
+        helper7(a);
+        helper8(a);
+        helper9(a);
+        helper10(a);
+        helper11(a);
+        helper12(a);
+        helper13(a);
+        helper14(a);
+        helper15(a);
+        helper16(a);
+        helper17(a);
+        helper18(a);
+        helper19(a);
+        helper20(a);
+        helper21(a);
+        helper22(a);
+        helper23(a);
+        helper24(a);
+        helper25(a);
+        helper26(a);
+        helper27(a);
+        helper28(a);
+        helper29(a);
+        helper30(a);
+        helper31(a);
+        helper0(a);
+        helper1(a);
+        helper2(a);
+        helper3(a);
+        helper4(a);
+        helper5(a);
+        total += external0.query(a);
+    }
+
+    function f7(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper7(a);
+        helper8(a);
+        helper9(a);
+        helper10(a);
+        helper11(a);
+        helper12(a);
+        helper13(a);
+        helper14(a);
+        helper15(a);
+        helper16(a);
+        helper17(a);
+        helper18(a);
+        helper19(a);
+        helper20(a);
+        helper21(a);
+        helper22(a);
+        helper23(a);
+        helper24(a);
+        helper25(a);
+        helper26(a);
+        helper27(a);
+        helper28(a);
+        helper29(a);
+        helper30(a);
+        helper31(a);
+        helper0(a);
+        helper1(a);
+        helper2(a);
+        helper3(a);
+        helper4(a);
+        helper5(a);
+        helper6(a);
+        total += external0.query(a);
+    }
+
+    function f8(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper8(a);
+        helper9(a);
+        helper10(a);
+        helper11(a);
+        helper12(a);
+        helper13(a);
+        helper14(a);
+        helper15(a);
+        helper16(a);
+        helper17(a);
+        helper18(a);
+        helper19(a);
+        helper20(a);
+        helper21(a);
+        helper22(a);
+        helper23(a);
+        helper24(a);
+        helper25(a);
+        helper26(a);
+        helper27(a);
+        helper28(a);
+        helper29(a);
+        helper30(a);
+        helper31(a);
+        helper0(a);
+        helper1(a);
+        helper2(a);
+        helper3(a);
+        helper4(a);
+        helper5(a);
+        helper6(a);
+        helper7(a);
+        total += external0.query(a);
+    }
+
+    function f9(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper9(a);
+        helper10(a);
+        helper11(a);
+        helper12(a);
+        helper13(a);
+        helper14(a);
+        helper15(a);
+        helper16(a);
+        helper17(a);
+        helper18(a);
+        helper19(a);
+        helper20(a);
+        helper21(a);
+        helper22(a);
+        helper23(a);
+        helper24(a);
+        helper25(a);
+        helper26(a);
+        helper27(a);
+        helper28(a);
+        helper29(a);
+        helper30(a);
+        helper31(a);
+        helper0(a);
+        helper1(a);
+        helper2(a);
+        helper3(a);
+        helper4(a);
+        helper5(a);
+        helper6(a);
+        helper7(a);
+        helper8(a);
+        total += external0.query(a);
+    }
+
+    function callback(uint256 value) external {
+        require(msg.sender == address(external0));
+        total = value;
+    }
+}
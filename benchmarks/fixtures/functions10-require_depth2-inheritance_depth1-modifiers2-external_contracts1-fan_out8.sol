@@ -0,0 +1,257 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+contract External0 {
+    function query(uint256 x) external returns (uint256) {
+        return x + 0;
+    }
+}
+
+contract Base0 {
+    uint256 internal base0;
+
+    function setBase0(uint256 value) public virtual {
+        require(value > base0);
+        base0 = value;
+    }
+}
+
+contract Benchmark is Base0 {
+    address internal owner;
+    bool internal stopped;
+    uint256 internal total;
+    External0 internal external0;
+
+    constructor() {
+        owner = msg.sender;
+    }
+
+    modifier guard0() {
+        require(!stopped);
+        _;
+    }
+
+    modifier guard1() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    function helper0(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper1(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper2(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper3(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper4(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper5(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper6(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper7(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function f0(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper0(a);
+        helper1(a);
+        helper2(a);
+        helper3(a);
+        helper4(a);
+        helper5(a);
+        helper6(a);
+        helper7(a);
+        total += external0.query(a);
+    }
+
+    function f1(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper1(a);
+        helper2(a);
+        helper3(a);
+        helper4(a);
+        helper5(a);
+        helper6(a);
+        helper7(a);
+        helper0(a);
+        total += external0.query(a);
+    }
+
+    function f2(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper2(a);
+        helper3(a);
+        helper4(a);
+        helper5(a);
+        helper6(a);
+        helper7(a);
+        helper0(a);
+        helper1(a);
+        total += external0.query(a);
+    }
+
+    function f3(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper3(a);
+        helper4(a);
+        helper5(a);
+        helper6(a);
+        helper7(a);
+        helper0(a);
+        helper1(a);
+        helper2(a);
+        total += external0.query(a);
+    }
+
+    function f4(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper4(a);
+        helper5(a);
+        helper6(a);
+        helper7(a);
+        helper0(a);
+        helper1(a);
+        helper2(a);
+        helper3(a);
+        total += external0.query(a);
+    }
+
+    function f5(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper5(a);
+        helper6(a);
+        helper7(a);
+        helper0(a);
+        helper1(a);
+        helper2(a);
+        helper3(a);
+        helper4(a);
+        total += external0.query(a);
+    }
+
+    function f6(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper6(a);
+        helper7(a);
+        helper0(a);
+        helper1(a);
+        helper2(a);
+        helper3(a);
+        helper4(a);
+        helper5(a);
+        total += external0.query(a);
+    }
+
+    function f7(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper7(a);
+        helper0(a);
+        helper1(a);
+        helper2(a);
+        helper3(a);
+        helper4(a);
+        helper5(a);
+        helper6(a);
+        total += external0.query(a);
+    }
+
+    function f8(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper0(a);
+        helper1(a);
+        helper2(a);
+        helper3(a);
+        helper4(a);
+        helper5(a);
+        helper6(a);
+        helper7(a);
+        total += external0.query(a);
+    }
+
+    function f9(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper1(a);
+        helper2(a);
+        helper3(a);
+        helper4(a);
+        helper5(a);
+        helper6(a);
+        helper7(a);
+        helper0(a);
+        total += external0.query(a);
+    }
+
+    function callback(uint256 value) external {
+        require(msg.sender == address(external0));
+        total = value;
+    }
+}
@@ -0,0 +1,254 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+contract External0 {
+    function query(uint256 x) external returns (uint256) {
+        return x + 0;
+    }
+}
+
+contract External1 {
+    function query(uint256 x) external returns (uint256) {
+        return x + 1;
+    }
+}
+
+contract External2 {
+    function query(uint256 x) external returns (uint256) {
+        return x + 2;
+    }
+}
+
+contract External3 {
+    function query(uint256 x) external returns (uint256) {
+        return x + 3;
+    }
+}
+
+contract External4 {
+    function query(uint256 x) external returns (uint256) {
+        return x + 4;
+    }
+}
+
+contract External5 {
+    function query(uint256 x) external returns (uint256) {
+        return x + 5;
+    }
+}
+
+contract External6 {
+    function query(uint256 x) external returns (uint256) {
+        return x + 6;
+    }
+}
+
+contract External7 {
+    function query(uint256 x) external returns (uint256) {
+        return x + 7;
+    }
+}
+
+contract External8 {
+    function query(uint256 x) external returns (uint256) {
+        return x + 8;
+    }
+}
+
+contract External9 {
+    function query(uint256 x) external returns (uint256) {
+        return x + 9;
+    }
+}
+
+contract External10 {
+    function query(uint256 x) external returns (uint256) {
+        return x + 10;
+    }
+}
+
+contract External11 {
+    function query(uint256 x) external returns (uint256) {
+        return x + 11;
+    }
+}
+
+contract External12 {
+    function query(uint256 x) external returns (uint256) {
+        return x + 12;
+    }
+}
+
+contract External13 {
+    function query(uint256 x) external returns (uint256) {
+        return x + 13;
+    }
+}
+
+contract External14 {
+    function query(uint256 x) external returns (uint256) {
+        return x + 14;
+    }
+}
+
+contract External15 {
+    function query(uint256 x) external returns (uint256) {
+        return x + 15;
+    }
+}
+
+contract Base0 {
+    uint256 internal base0;
+
+    function setBase0(uint256 value) public virtual {
+        require(value > base0);
+        base0 = value;
+    }
+}
+
+contract Benchmark is Base0 {
+    address internal owner;
+    bool internal stopped;
+    uint256 internal total;
+    External0 internal external0;
+    External1 internal external1;
+    External2 internal external2;
+    External3 internal external3;
+    External4 internal external4;
+    External5 internal external5;
+    External6 internal external6;
+    External7 internal external7;
+    External8 internal external8;
+    External9 internal external9;
+    External10 internal external10;
+    External11 internal external11;
+    External12 internal external12;
+    External13 internal external13;
+    External14 internal external14;
+    External15 internal external15;
+
+    constructor() {
+        owner = msg.sender;
+    }
+
+    modifier guard0() {
+        require(!stopped);
+        _;
+    }
+
+    modifier guard1() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    function helper0(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper1(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function f0(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper0(a);
+        helper1(a);
+        total += external0.query(a);
+    }
+
+    function f1(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external1.query(a);
+    }
+
+    function f2(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper0(a);
+        helper1(a);
+        total += external2.query(a);
+    }
+
+    function f3(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external3.query(a);
+    }
+
+    function f4(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper0(a);
+        helper1(a);
+        total += external4.query(a);
+    }
+
+    function f5(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external5.query(a);
+    }
+
+    function f6(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper0(a);
+        helper1(a);
+        total += external6.query(a);
+    }
+
+    function f7(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external7.query(a);
+    }
+
+    function f8(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper0(a);
+        helper1(a);
+        total += external8.query(a);
+    }
+
+    function f9(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external9.query(a);
+    }
+
+    function callback(uint256 value) external {
+        require(msg.sender == address(external0));
+        total = value;
+    }
+}
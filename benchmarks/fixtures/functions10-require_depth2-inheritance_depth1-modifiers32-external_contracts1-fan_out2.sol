@@ -0,0 +1,299 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+contract External0 {
+    function query(uint256 x) external returns (uint256) {
+        return x + 0;
+    }
+}
+
+contract Base0 {
+    uint256 internal base0;
+
+    function setBase0(uint256 value) public virtual {
+        require(value > base0);
+        base0 = value;
+    }
+}
+
+contract Benchmark is Base0 {
+    address internal owner;
+    bool internal stopped;
+    uint256 internal total;
+    External0 internal external0;
+
+    constructor() {
+        owner = msg.sender;
+    }
+
+    modifier guard0() {
+        require(!stopped);
+        _;
+    }
+
+    modifier guard1() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard2() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard3() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard4() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard5() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard6() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard7() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard8() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard9() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard10() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard11() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard12() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard13() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard14() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard15() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard16() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard17() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard18() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard19() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard20() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard21() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard22() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard23() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard24() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard25() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard26() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard27() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard28() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard29() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard30() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    modifier guard31() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    function helper0(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper1(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function f0(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper0(a);
+        helper1(a);
+        total += external0.query(a);
+    }
+
+    function f1(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external0.query(a);
+    }
+
+    function f2(uint256 a) public guard2() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper0(a);
+        helper1(a);
+        total += external0.query(a);
+    }
+
+    function f3(uint256 a) public guard3() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external0.query(a);
+    }
+
+    function f4(uint256 a) public guard4() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper0(a);
+        helper1(a);
+        total += external0.query(a);
+    }
+
+    function f5(uint256 a) public guard5() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external0.query(a);
+    }
+
+    function f6(uint256 a) public guard6() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper0(a);
+        helper1(a);
+        total += external0.query(a);
+    }
+
+    function f7(uint256 a) public guard7() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external0.query(a);
+    }
+
+    function f8(uint256 a) public guard8() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper0(a);
+        helper1(a);
+        total += external0.query(a);
+    }
+
+    function f9(uint256 a) public guard9() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external0.query(a);
+    }
+
+    function callback(uint256 value) external {
+        require(msg.sender == address(external0));
+        total = value;
+    }
+}
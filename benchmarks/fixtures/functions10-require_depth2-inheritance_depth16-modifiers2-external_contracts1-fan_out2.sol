@@ -0,0 +1,284 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+contract External0 {
+    function query(uint256 x) external returns (uint256) {
+        return x + 0;
+    }
+}
+
+contract Base0 {
+    uint256 internal base0;
+
+    function setBase0(uint256 value) public virtual {
+        require(value > base0);
+        base0 = value;
+    }
+}
+
+contract Base1 is Base0 {
+    uint256 internal base1;
+
+    function setBase1(uint256 value) public virtual {
+        require(value > base1);
+        base1 = value;
+    }
+}
+
+contract Base2 is Base1 {
+    uint256 internal base2;
+
+    function setBase2(uint256 value) public virtual {
+        require(value > base2);
+        base2 = value;
+    }
+}
+
+contract Base3 is Base2 {
+    uint256 internal base3;
+
+    function setBase3(uint256 value) public virtual {
+        require(value > base3);
+        base3 = value;
+    }
+}
+
+contract Base4 is Base3 {
+    uint256 internal base4;
+
+    function setBase4(uint256 value) public virtual {
+        require(value > base4);
+        base4 = value;
+    }
+}
+
+contract Base5 is Base4 {
+    uint256 internal base5;
+
+    function setBase5(uint256 value) public virtual {
+        require(value > base5);
+        base5 = value;
+    }
+}
+
+contract Base6 is Base5 {
+    uint256 internal base6;
+
+    function setBase6(uint256 value) public virtual {
+        require(value > base6);
+        base6 = value;
+    }
+}
+
+contract Base7 is Base6 {
+    uint256 internal base7;
+
+    function setBase7(uint256 value) public virtual {
+        require(value > base7);
+        base7 = value;
+    }
+}
+
+contract Base8 is Base7 {
+    uint256 internal base8;
+
+    function setBase8(uint256 value) public virtual {
+        require(value > base8);
+        base8 = value;
+    }
+}
+
+contract Base9 is Base8 {
+    uint256 internal base9;
+
+    function setBase9(uint256 value) public virtual {
+        require(value > base9);
+        base9 = value;
+    }
+}
+
+contract Base10 is Base9 {
+    uint256 internal base10;
+
+    function setBase10(uint256 value) public virtual {
+        require(value > base10);
+        base10 = value;
+    }
+}
+
+contract Base11 is Base10 {
+    uint256 internal base11;
+
+    function setBase11(uint256 value) public virtual {
+        require(value > base11);
+        base11 = value;
+    }
+}
+
+contract Base12 is Base11 {
+    uint256 internal base12;
+
+    function setBase12(uint256 value) public virtual {
+        require(value > base12);
+        base12 = value;
+    }
+}
+
+contract Base13 is Base12 {
+    uint256 internal base13;
+
+    function setBase13(uint256 value) public virtual {
+        require(value > base13);
+        base13 = value;
+    }
+}
+
+contract Base14 is Base13 {
+    uint256 internal base14;
+
+    function setBase14(uint256 value) public virtual {
+        require(value > base14);
+        base14 = value;
+    }
+}
+
+contract Base15 is Base14 {
+    uint256 internal base15;
+
+    function setBase15(uint256 value) public virtual {
+        require(value > base15);
+        base15 = value;
+    }
+}
+
+contract Benchmark is Base15 {
+    address internal owner;
+    bool internal stopped;
+    uint256 internal total;
+    External0 internal external0;
+
+    constructor() {
+        owner = msg.sender;
+    }
+
+    modifier guard0() {
+        require(!stopped);
+        _;
+    }
+
+    modifier guard1() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    function helper0(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function helper1(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        require(h1 > total);
+        total += h1;
+        return total;
+    }
+
+    function f0(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper0(a);
+        helper1(a);
+        total += external0.query(a);
+    }
+
+    function f1(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external0.query(a);
+    }
+
+    function f2(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper0(a);
+        helper1(a);
+        total += external0.query(a);
+    }
+
+    function f3(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external0.query(a);
+    }
+
+    function f4(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper0(a);
+        helper1(a);
+        total += external0.query(a);
+    }
+
+    function f5(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external0.query(a);
+    }
+
+    function f6(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper0(a);
+        helper1(a);
+        total += external0.query(a);
+    }
+
+    function f7(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external0.query(a);
+    }
+
+    function f8(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        require(v1 != 0);
+        helper0(a);
+        helper1(a);
+        total += external0.query(a);
+    }
+
+    function f9(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        require(address(uint160(v1)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external0.query(a);
+    }
+
+    function callback(uint256 value) external {
+        require(msg.sender == address(external0));
+        total = value;
+    }
+}
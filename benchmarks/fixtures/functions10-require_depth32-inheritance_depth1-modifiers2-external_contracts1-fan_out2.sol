@@ -0,0 +1,509 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+contract External0 {
+    function query(uint256 x) external returns (uint256) {
+        return x + 0;
+    }
+}
+
+contract Base0 {
+    uint256 internal base0;
+
+    function setBase0(uint256 value) public virtual {
+        require(value > base0);
+        base0 = value;
+    }
+}
+
+contract Benchmark is Base0 {
+    address internal owner;
+    bool internal stopped;
+    uint256 internal total;
+    External0 internal external0;
+
+    constructor() {
+        owner = msg.sender;
+    }
+
+    modifier guard0() {
+        require(!stopped);
+        _;
+    }
+
+    modifier guard1() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    function helper0(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        uint256 h2 = h1 + 1;
+        uint256 h3 = h2 + 1;
+        uint256 h4 = h3 + 1;
+        uint256 h5 = h4 + 1;
+        uint256 h6 = h5 + 1;
+        uint256 h7 = h6 + 1;
+        uint256 h8 = h7 + 1;
+        uint256 h9 = h8 + 1;
+        uint256 h10 = h9 + 1;
+        uint256 h11 = h10 + 1;
+        uint256 h12 = h11 + 1;
+        uint256 h13 = h12 + 1;
+        uint256 h14 = h13 + 1;
+        uint256 h15 = h14 + 1;
+        uint256 h16 = h15 + 1;
+        uint256 h17 = h16 + 1;
+        uint256 h18 = h17 + 1;
+        uint256 h19 = h18 + 1;
+        uint256 h20 = h19 + 1;
+        uint256 h21 = h20 + 1;
+        uint256 h22 = h21 + 1;
+        uint256 h23 = h22 + 1;
+        uint256 h24 = h23 + 1;
+        uint256 h25 = h24 + 1;
+        uint256 h26 = h25 + 1;
+        uint256 h27 = h26 + 1;
+        uint256 h28 = h27 + 1;
+        uint256 h29 = h28 + 1;
+        uint256 h30 = h29 + 1;
+        uint256 h31 = h30 + 1;
+        require(h31 > total);
+        total += h31;
+        return total;
+    }
+
+    function helper1(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        uint256 h2 = h1 + 1;
+        uint256 h3 = h2 + 1;
+        uint256 h4 = h3 + 1;
+        uint256 h5 = h4 + 1;
+        uint256 h6 = h5 + 1;
+        uint256 h7 = h6 + 1;
+        uint256 h8 = h7 + 1;
+        uint256 h9 = h8 + 1;
+        uint256 h10 = h9 + 1;
+        uint256 h11 = h10 + 1;
+        uint256 h12 = h11 + 1;
+        uint256 h13 = h12 + 1;
+        uint256 h14 = h13 + 1;
+        uint256 h15 = h14 + 1;
+        uint256 h16 = h15 + 1;
+        uint256 h17 = h16 + 1;
+        uint256 h18 = h17 + 1;
+        uint256 h19 = h18 + 1;
+        uint256 h20 = h19 + 1;
+        uint256 h21 = h20 + 1;
+        uint256 h22 = h21 + 1;
+        uint256 h23 = h22 + 1;
+        uint256 h24 = h23 + 1;
+        uint256 h25 = h24 + 1;
+        uint256 h26 = h25 + 1;
+        uint256 h27 = h26 + 1;
+        uint256 h28 = h27 + 1;
+        uint256 h29 = h28 + 1;
+        uint256 h30 = h29 + 1;
+        uint256 h31 = h30 + 1;
+        require(h31 > total);
+        total += h31;
+        return total;
+    }
+
+    function f0(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        uint256 v2 = v1 + 1;
+        uint256 v3 = v2 + 1;
+        uint256 v4 = v3 + 1;
+        uint256 v5 = v4 + 1;
+        uint256 v6 = v5 + 1;
+        uint256 v7 = v6 + 1;
+        uint256 v8 = v7 + 1;
+        uint256 v9 = v8 + 1;
+        uint256 v10 = v9 + 1;
+        uint256 v11 = v10 + 1;
+        uint256 v12 = v11 + 1;
+        uint256 v13 = v12 + 1;
+        uint256 v14 = v13 + 1;
+        uint256 v15 = v14 + 1;
+        uint256 v16 = v15 + 1;
+        uint256 v17 = v16 + 1;
+        uint256 v18 = v17 + 1;
+        uint256 v19 = v18 + 1;
+        uint256 v20 = v19 + 1;
+        uint256 v21 = v20 + 1;
+        uint256 v22 = v21 + 1;
+        uint256 v23 = v22 + 1;
+        uint256 v24 = v23 + 1;
+        uint256 v25 = v24 + 1;
+        uint256 v26 = v25 + 1;
+        uint256 v27 = v26 + 1;
+        uint256 v28 = v27 + 1;
+        uint256 v29 = v28 + 1;
+        uint256 v30 = v29 + 1;
+        uint256 v31 = v30 + 1;
+        require(v31 != 0);
+        helper0(a);
+        helper1(a);
+        total += external0.query(a);
+    }
+
+    function f1(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        uint256 v2 = v1 + 1;
+        uint256 v3 = v2 + 1;
+        uint256 v4 = v3 + 1;
+        uint256 v5 = v4 + 1;
+        uint256 v6 = v5 + 1;
+        uint256 v7 = v6 + 1;
+        uint256 v8 = v7 + 1;
+        uint256 v9 = v8 + 1;
+        uint256 v10 = v9 + 1;
+        uint256 v11 = v10 + 1;
+        uint256 v12 = v11 + 1;
+        uint256 v13 = v12 + 1;
+        uint256 v14 = v13 + 1;
+        uint256 v15 = v14 + 1;
+        uint256 v16 = v15 + 1;
+        uint256 v17 = v16 + 1;
+        uint256 v18 = v17 + 1;
+        uint256 v19 = v18 + 1;
+        uint256 v20 = v19 + 1;
+        uint256 v21 = v20 + 1;
+        uint256 v22 = v21 + 1;
+        uint256 v23 = v22 + 1;
+        uint256 v24 = v23 + 1;
+        uint256 v25 = v24 + 1;
+        uint256 v26 = v25 + 1;
+        uint256 v27 = v26 + 1;
+        uint256 v28 = v27 + 1;
+        uint256 v29 = v28 + 1;
+        uint256 v30 = v29 + 1;
+        uint256 v31 = v30 + 1;
+        require(address(uint160(v31)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external0.query(a);
+    }
+
+    function f2(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        uint256 v2 = v1 + 1;
+        uint256 v3 = v2 + 1;
+        uint256 v4 = v3 + 1;
+        uint256 v5 = v4 + 1;
+        uint256 v6 = v5 + 1;
+        uint256 v7 = v6 + 1;
+        uint256 v8 = v7 + 1;
+        uint256 v9 = v8 + 1;
+        uint256 v10 = v9 + 1;
+        uint256 v11 = v10 + 1;
+        uint256 v12 = v11 + 1;
+        uint256 v13 = v12 + 1;
+        uint256 v14 = v13 + 1;
+        uint256 v15 = v14 + 1;
+        uint256 v16 = v15 + 1;
+        uint256 v17 = v16 + 1;
+        uint256 v18 = v17 + 1;
+        uint256 v19 = v18 + 1;
+        uint256 v20 = v19 + 1;
+        uint256 v21 = v20 + 1;
+        uint256 v22 = v21 + 1;
+        uint256 v23 = v22 + 1;
+        uint256 v24 = v23 + 1;
+        uint256 v25 = v24 + 1;
+        uint256 v26 = v25 + 1;
+        uint256 v27 = v26 + 1;
+        uint256 v28 = v27 + 1;
+        uint256 v29 = v28 + 1;
+        uint256 v30 = v29 + 1;
+        uint256 v31 = v30 + 1;
+        require(v31 != 0);
+        helper0(a);
+        helper1(a);
+        total += external0.query(a);
+    }
+
+    function f3(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        uint256 v2 = v1 + 1;
+        uint256 v3 = v2 + 1;
+        uint256 v4 = v3 + 1;
+        uint256 v5 = v4 + 1;
+        uint256 v6 = v5 + 1;
+        uint256 v7 = v6 + 1;
+        uint256 v8 = v7 + 1;
+        uint256 v9 = v8 + 1;
+        uint256 v10 = v9 + 1;
+        uint256 v11 = v10 + 1;
+        uint256 v12 = v11 + 1;
+        uint256 v13 = v12 + 1;
+        uint256 v14 = v13 + 1;
+        uint256 v15 = v14 + 1;
+        uint256 v16 = v15 + 1;
+        uint256 v17 = v16 + 1;
+        uint256 v18 = v17 + 1;
+        uint256 v19 = v18 + 1;
+        uint256 v20 = v19 + 1;
+        uint256 v21 = v20 + 1;
+        uint256 v22 = v21 + 1;
+        uint256 v23 = v22 + 1;
+        uint256 v24 = v23 + 1;
+        uint256 v25 = v24 + 1;
+        uint256 v26 = v25 + 1;
+        uint256 v27 = v26 + 1;
+        uint256 v28 = v27 + 1;
+        uint256 v29 = v28 + 1;
+        uint256 v30 = v29 + 1;
+        uint256 v31 = v30 + 1;
+        require(address(uint160(v31)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external0.query(a);
+    }
+
+    function f4(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        uint256 v2 = v1 + 1;
+        uint256 v3 = v2 + 1;
+        uint256 v4 = v3 + 1;
+        uint256 v5 = v4 + 1;
+        uint256 v6 = v5 + 1;
+        uint256 v7 = v6 + 1;
+        uint256 v8 = v7 + 1;
+        uint256 v9 = v8 + 1;
+        uint256 v10 = v9 + 1;
+        uint256 v11 = v10 + 1;
+        uint256 v12 = v11 + 1;
+        uint256 v13 = v12 + 1;
+        uint256 v14 = v13 + 1;
+        uint256 v15 = v14 + 1;
+        uint256 v16 = v15 + 1;
+        uint256 v17 = v16 + 1;
+        uint256 v18 = v17 + 1;
+        uint256 v19 = v18 + 1;
+        uint256 v20 = v19 + 1;
+        uint256 v21 = v20 + 1;
+        uint256 v22 = v21 + 1;
+        uint256 v23 = v22 + 1;
+        uint256 v24 = v23 + 1;
+        uint256 v25 = v24 + 1;
+        uint256 v26 = v25 + 1;
+        uint256 v27 = v26 + 1;
+        uint256 v28 = v27 + 1;
+        uint256 v29 = v28 + 1;
+        uint256 v30 = v29 + 1;
+        uint256 v31 = v30 + 1;
+        require(v31 != 0);
+        helper0(a);
+        helper1(a);
+        total += external0.query(a);
+    }
+
+    function f5(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        uint256 v2 = v1 + 1;
+        uint256 v3 = v2 + 1;
+        uint256 v4 = v3 + 1;
+        uint256 v5 = v4 + 1;
+        uint256 v6 = v5 + 1;
+        uint256 v7 = v6 + 1;
+        uint256 v8 = v7 + 1;
+        uint256 v9 = v8 + 1;
+        uint256 v10 = v9 + 1;
+        uint256 v11 = v10 + 1;
+        uint256 v12 = v11 + 1;
+        uint256 v13 = v12 + 1;
+        uint256 v14 = v13 + 1;
+        uint256 v15 = v14 + 1;
+        uint256 v16 = v15 + 1;
+        uint256 v17 = v16 + 1;
+        uint256 v18 = v17 + 1;
+        uint256 v19 = v18 + 1;
+        uint256 v20 = v19 + 1;
+        uint256 v21 = v20 + 1;
+        uint256 v22 = v21 + 1;
+        uint256 v23 = v22 + 1;
+        uint256 v24 = v23 + 1;
+        uint256 v25 = v24 + 1;
+        uint256 v26 = v25 + 1;
+        uint256 v27 = v26 + 1;
+        uint256 v28 = v27 + 1;
+        uint256 v29 = v28 + 1;
+        uint256 v30 = v29 + 1;
+        uint256 v31 = v30 + 1;
+        require(address(uint160(v31)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external0.query(a);
+    }
+
+    function f6(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        uint256 v2 = v1 + 1;
+        uint256 v3 = v2 + 1;
+        uint256 v4 = v3 + 1;
+        uint256 v5 = v4 + 1;
+        uint256 v6 = v5 + 1;
+        uint256 v7 = v6 + 1;
+        uint256 v8 = v7 + 1;
+        uint256 v9 = v8 + 1;
+        uint256 v10 = v9 + 1;
+        uint256 v11 = v10 + 1;
+        uint256 v12 = v11 + 1;
+        uint256 v13 = v12 + 1;
+        uint256 v14 = v13 + 1;
+        uint256 v15 = v14 + 1;
+        uint256 v16 = v15 + 1;
+        uint256 v17 = v16 + 1;
+        uint256 v18 = v17 + 1;
+        uint256 v19 = v18 + 1;
+        uint256 v20 = v19 + 1;
+        uint256 v21 = v20 + 1;
+        uint256 v22 = v21 + 1;
+        uint256 v23 = v22 + 1;
+        uint256 v24 = v23 + 1;
+        uint256 v25 = v24 + 1;
+        uint256 v26 = v25 + 1;
+        uint256 v27 = v26 + 1;
+        uint256 v28 = v27 + 1;
+        uint256 v29 = v28 + 1;
+        uint256 v30 = v29 + 1;
+        uint256 v31 = v30 + 1;
+        require(v31 != 0);
+        helper0(a);
+        helper1(a);
+        total += external0.query(a);
+    }
+
+    function f7(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        uint256 v2 = v1 + 1;
+        uint256 v3 = v2 + 1;
+        uint256 v4 = v3 + 1;
+        uint256 v5 = v4 + 1;
+        uint256 v6 = v5 + 1;
+        uint256 v7 = v6 + 1;
+        uint256 v8 = v7 + 1;
+        uint256 v9 = v8 + 1;
+        uint256 v10 = v9 + 1;
+        uint256 v11 = v10 + 1;
+        uint256 v12 = v11 + 1;
+        uint256 v13 = v12 + 1;
+        uint256 v14 = v13 + 1;
+        uint256 v15 = v14 + 1;
+        uint256 v16 = v15 + 1;
+        uint256 v17 = v16 + 1;
+        uint256 v18 = v17 + 1;
+        uint256 v19 = v18 + 1;
+        uint256 v20 = v19 + 1;
+        uint256 v21 = v20 + 1;
+        uint256 v22 = v21 + 1;
+        uint256 v23 = v22 + 1;
+        uint256 v24 = v23 + 1;
+        uint256 v25 = v24 + 1;
+        uint256 v26 = v25 + 1;
+        uint256 v27 = v26 + 1;
+        uint256 v28 = v27 + 1;
+        uint256 v29 = v28 + 1;
+        uint256 v30 = v29 + 1;
+        uint256 v31 = v30 + 1;
+        require(address(uint160(v31)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external0.query(a);
+    }
+
+    function f8(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        uint256 v2 = v1 + 1;
+        uint256 v3 = v2 + 1;
+        uint256 v4 = v3 + 1;
+        uint256 v5 = v4 + 1;
+        uint256 v6 = v5 + 1;
+        uint256 v7 = v6 + 1;
+        uint256 v8 = v7 + 1;
+        uint256 v9 = v8 + 1;
+        uint256 v10 = v9 + 1;
+        uint256 v11 = v10 + 1;
+        uint256 v12 = v11 + 1;
+        uint256 v13 = v12 + 1;
+        uint256 v14 = v13 + 1;
+        uint256 v15 = v14 + 1;
+        uint256 v16 = v15 + 1;
+        uint256 v17 = v16 + 1;
+        uint256 v18 = v17 + 1;
+        uint256 v19 = v18 + 1;
+        uint256 v20 = v19 + 1;
+        uint256 v21 = v20 + 1;
+        uint256 v22 = v21 + 1;
+        uint256 v23 = v22 + 1;
+        uint256 v24 = v23 + 1;
+        uint256 v25 = v24 + 1;
+        uint256 v26 = v25 + 1;
+        uint256 v27 = v26 + 1;
+        uint256 v28 = v27 + 1;
+        uint256 v29 = v28 + 1;
+        uint256 v30 = v29 + 1;
+        uint256 v31 = v30 + 1;
+        require(v31 != 0);
+        helper0(a);
+        helper1(a);
+        total += external0.query(a);
+    }
+
+    function f9(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        uint256 v2 = v1 + 1;
+        uint256 v3 = v2 + 1;
+        uint256 v4 = v3 + 1;
+        uint256 v5 = v4 + 1;
+        uint256 v6 = v5 + 1;
+        uint256 v7 = v6 + 1;
+        uint256 v8 = v7 + 1;
+        uint256 v9 = v8 + 1;
+        uint256 v10 = v9 + 1;
+        uint256 v11 = v10 + 1;
+        uint256 v12 = v11 + 1;
+        uint256 v13 = v12 + 1;
+        uint256 v14 = v13 + 1;
+        uint256 v15 = v14 + 1;
+        uint256 v16 = v15 + 1;
+        uint256 v17 = v16 + 1;
+        uint256 v18 = v17 + 1;
+        uint256 v19 = v18 + 1;
+        uint256 v20 = v19 + 1;
+        uint256 v21 = v20 + 1;
+        uint256 v22 = v21 + 1;
+        uint256 v23 = v22 + 1;
+        uint256 v24 = v23 + 1;
+        uint256 v25 = v24 + 1;
+        uint256 v26 = v25 + 1;
+        uint256 v27 = v26 + 1;
+        uint256 v28 = v27 + 1;
+        uint256 v29 = v28 + 1;
+        uint256 v30 = v29 + 1;
+        uint256 v31 = v30 + 1;
+        require(address(uint160(v31)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external0.query(a);
+    }
+
+    function callback(uint256 value) external {
+        require(msg.sender == address(external0));
+        total = value;
+    }
+}
@@ -0,0 +1,221 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+contract External0 {
+    function query(uint256 x) external returns (uint256) {
+        return x + 0;
+    }
+}
+
+contract Base0 {
+    uint256 internal base0;
+
+    function setBase0(uint256 value) public virtual {
+        require(value > base0);
+        base0 = value;
+    }
+}
+
+contract Benchmark is Base0 {
+    address internal owner;
+    bool internal stopped;
+    uint256 internal total;
+    External0 internal external0;
+
+    constructor() {
+        owner = msg.sender;
+    }
+
+    modifier guard0() {
+        require(!stopped);
+        _;
+    }
+
+    modifier guard1() {
+        require(msg.sender == owner);
+        _;
+    }
+
+    function helper0(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        uint256 h2 = h1 + 1;
+        uint256 h3 = h2 + 1;
+        uint256 h4 = h3 + 1;
+        uint256 h5 = h4 + 1;
+        uint256 h6 = h5 + 1;
+        uint256 h7 = h6 + 1;
+        require(h7 > total);
+        total += h7;
+        return total;
+    }
+
+    function helper1(uint256 a) internal returns (uint256) {
+        uint256 h0 = uint256(a);
+        uint256 h1 = h0 + 1;
+        uint256 h2 = h1 + 1;
+        uint256 h3 = h2 + 1;
+        uint256 h4 = h3 + 1;
+        uint256 h5 = h4 + 1;
+        uint256 h6 = h5 + 1;
+        uint256 h7 = h6 + 1;
+        require(h7 > total);
+        total += h7;
+        return total;
+    }
+
+    function f0(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        uint256 v2 = v1 + 1;
+        uint256 v3 = v2 + 1;
+        uint256 v4 = v3 + 1;
+        uint256 v5 = v4 + 1;
+        uint256 v6 = v5 + 1;
+        uint256 v7 = v6 + 1;
+        require(v7 != 0);
+        helper0(a);
+        helper1(a);
+        total += external0.query(a);
+    }
+
+    function f1(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        uint256 v2 = v1 + 1;
+        uint256 v3 = v2 + 1;
+        uint256 v4 = v3 + 1;
+        uint256 v5 = v4 + 1;
+        uint256 v6 = v5 + 1;
+        uint256 v7 = v6 + 1;
+        require(address(uint160(v7)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external0.query(a);
+    }
+
+    function f2(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        uint256 v2 = v1 + 1;
+        uint256 v3 = v2 + 1;
+        uint256 v4 = v3 + 1;
+        uint256 v5 = v4 + 1;
+        uint256 v6 = v5 + 1;
+        uint256 v7 = v6 + 1;
+        require(v7 != 0);
+        helper0(a);
+        helper1(a);
+        total += external0.query(a);
+    }
+
+    function f3(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        uint256 v2 = v1 + 1;
+        uint256 v3 = v2 + 1;
+        uint256 v4 = v3 + 1;
+        uint256 v5 = v4 + 1;
+        uint256 v6 = v5 + 1;
+        uint256 v7 = v6 + 1;
+        require(address(uint160(v7)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external0.query(a);
+    }
+
+    function f4(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        uint256 v2 = v1 + 1;
+        uint256 v3 = v2 + 1;
+        uint256 v4 = v3 + 1;
+        uint256 v5 = v4 + 1;
+        uint256 v6 = v5 + 1;
+        uint256 v7 = v6 + 1;
+        require(v7 != 0);
+        helper0(a);
+        helper1(a);
+        total += external0.query(a);
+    }
+
+    function f5(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        uint256 v2 = v1 + 1;
+        uint256 v3 = v2 + 1;
+        uint256 v4 = v3 + 1;
+        uint256 v5 = v4 + 1;
+        uint256 v6 = v5 + 1;
+        uint256 v7 = v6 + 1;
+        require(address(uint160(v7)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external0.query(a);
+    }
+
+    function f6(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        uint256 v2 = v1 + 1;
+        uint256 v3 = v2 + 1;
+        uint256 v4 = v3 + 1;
+        uint256 v5 = v4 + 1;
+        uint256 v6 = v5 + 1;
+        uint256 v7 = v6 + 1;
+        require(v7 != 0);
+        helper0(a);
+        helper1(a);
+        total += external0.query(a);
+    }
+
+    function f7(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        uint256 v2 = v1 + 1;
+        uint256 v3 = v2 + 1;
+        uint256 v4 = v3 + 1;
+        uint256 v5 = v4 + 1;
+        uint256 v6 = v5 + 1;
+        uint256 v7 = v6 + 1;
+        require(address(uint160(v7)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external0.query(a);
+    }
+
+    function f8(uint256 a) public guard0() {
+        uint256 v0 = uint256(a);
+        uint256 v1 = v0 + 1;
+        uint256 v2 = v1 + 1;
+        uint256 v3 = v2 + 1;
+        uint256 v4 = v3 + 1;
+        uint256 v5 = v4 + 1;
+        uint256 v6 = v5 + 1;
+        uint256 v7 = v6 + 1;
+        require(v7 != 0);
+        helper0(a);
+        helper1(a);
+        total += external0.query(a);
+    }
+
+    function f9(uint256 a) public guard1() {
+        uint256 v0 = uint256(uint160(msg.sender));
+        uint256 v1 = v0 + 1;
+        uint256 v2 = v1 + 1;
+        uint256 v3 = v2 + 1;
+        uint256 v4 = v3 + 1;
+        uint256 v5 = v4 + 1;
+        uint256 v6 = v5 + 1;
+        uint256 v7 = v6 + 1;
+        require(address(uint160(v7)) == owner);
+        helper1(a);
+        helper0(a);
+        total += external0.query(a);
+    }
+
+    function callback(uint256 value) external {
+        require(msg.sender == address(external0));
+        total = value;
+    }
+}
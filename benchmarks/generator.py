@@ -0,0 +1,139 @@
+'''
+Generates synthetic Solidity contracts exercising the detectors, scaled by a few parameters:
+
+    functions           public functions of the benchmarked contract
+    require_depth       local variables a require condition goes through before reaching a parameter, state variable or msg.sender
+    inheritance_depth   contracts in the inheritance chain above the benchmarked contract
+    modifiers           guard modifiers, applied round robin to the public functions
+    external_contracts  state variables of contract type, called from the public functions
+    fan_out             internal functions called by every public function
+
+Usage: python3 -m benchmarks.generator <output directory>
+'''
+import os
+import sys
+
+BASE_PARAMETERS = {
+    'functions': 10,
+    'require_depth': 2,
+    'inheritance_depth': 1,
+    'modifiers': 2,
+    'external_contracts': 1,
+    'fan_out': 2,
+}
+
+# every parameter is scaled on its own, the others keep their base value
+SCALES = {
+    'functions': (10, 40, 160),
+    'require_depth': (2, 8, 32),
+    'inheritance_depth': (1, 4, 16),
+    'modifiers': (2, 8, 32),
+    'external_contracts': (1, 4, 16),
+    'fan_out': (2, 8, 32),
+}
+
+def fixture_name(parameters: dict) -> str:
+    return '-'.join(f'{name}{parameters[name]}' for name in BASE_PARAMETERS)
+
+def parameter_grid() -> list[dict]:
+    grid = {}
+
+    for name, values in SCALES.items():
+        for value in values:
+            parameters = {**BASE_PARAMETERS, name: value}
+            grid.setdefault(fixture_name(parameters), parameters)
+
+    return list(grid.values())
+
+# declares v0 = source and v(i) = v(i-1) + 1, returns the last variable
+def require_chain(source: str, depth: int, prefix: str) -> tuple[list[str], str]:
+    lines = [f'uint256 {prefix}0 = uint256({source});']
+
+    for i in range(1, depth):
+        lines.append(f'uint256 {prefix}{i} = {prefix}{i - 1} + 1;')
+
+    return lines, f'{prefix}{depth - 1}'
+
+def generate_external_contract(index: int) -> str:
+    return f'''contract External{index} {{
+    function query(uint256 x) external returns (uint256) {{
+        return x + {index};
+    }}
+}}
+'''
+
+def generate_base_contract(index: int) -> str:
+    parent = f' is Base{index - 1}' if index else ''
+
+    return f'''contract Base{index}{parent} {{
+    uint256 internal base{index};
+
+    function setBase{index}(uint256 value) public virtual {{
+        require(value > base{index});
+        base{index} = value;
+    }}
+}}
+'''
+
+def generate_contract(functions: int, require_depth: int, inheritance_depth: int, modifiers: int, external_contracts: int, fan_out: int) -> str:
+    parent = f' is Base{inheritance_depth - 1}' if inheritance_depth else ''
+    body = ['    address internal owner;', '    bool internal stopped;', '    uint256 internal total;']
+
+    body += [f'    External{i} internal external{i};' for i in range(external_contracts)]
+    body.append('')
+
+    body += ['    constructor() {', '        owner = msg.sender;', '    }', '']
+
+    for i in range(modifiers):
+        condition = '!stopped' if i == 0 else 'msg.sender == owner'
+        body += [f'    modifier guard{i}() {{', f'        require({condition});', '        _;', '    }', '']
+
+    helpers = max(fan_out, 1)
+    for i in range(helpers):
+        lines, last = require_chain('a', require_depth, 'h')
+        body.append(f'    function helper{i}(uint256 a) internal returns (uint256) {{')
+        body += [f'        {line}' for line in lines]
+        body += [f'        require({last} > total);', f'        total += {last};', '        return total;', '    }', '']
+
+    for i in range(functions):
+        modifier = f' guard{i % modifiers}()' if modifiers else ''
+        lines, last = require_chain('uint160(msg.sender)' if i % 2 else 'a', require_depth, 'v')
+
+        body.append(f'    function f{i}(uint256 a) public{modifier} {{')
+        body += [f'        {line}' for line in lines]
+        body.append(f'        require({last} != 0);' if i % 2 == 0 else f'        require(address(uint160({last})) == owner);')
+
+        for j in range(fan_out):
+            body.append(f'        helper{(i + j) % helpers}(a);')
+
+        if external_contracts:
+            body.append(f'        total += external{i % external_contracts}.query(a);')
+
+        body += ['    }', '']
+
+    if external_contracts:
+        body += ['    function callback(uint256 value) external {', '        require(msg.sender == address(external0));', '        total = value;', '    }']
+
+    contracts = [generate_external_contract(i) for i in range(external_contracts)]
+    contracts += [generate_base_contract(i) for i in range(inheritance_depth)]
+    contracts.append(f'contract Benchmark{parent} {{\n' + '\n'.join(body).rstrip() + '\n}\n')
+
+    return '// SPDX-License-Identifier: MIT\npragma solidity ^0.8.0;\n\n' + '\n'.join(contracts)
+
+def write_sources(directory: str) -> list[str]:
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+
+    for parameters in parameter_grid():
+        path = os.path.join(directory, f'{fixture_name(parameters)}.sol')
+
+        with open(path, 'w') as f:
+            f.write(generate_contract(**parameters))
+
+        paths.append(path)
+
+    return paths
+
+if __name__ == '__main__':
+    for path in write_sources(sys.argv[1]):
+        print(path)
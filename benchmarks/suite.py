@@ -0,0 +1,115 @@
+'''
+Times every detector and the utils helpers on the precompiled fixtures, one fixture per point of the parameter grid of benchmarks.generator.
+Every run of a measurement loads the fixture again, so neither the analysis index nor the expression caches of slither carry over from one run to the next.
+Results are written as json, to be compared between commits.
+
+The fixtures are committed, a missing fixture is an error. Rebuild them with benchmarks.build_fixtures after changing the generator.
+
+Usage: python3 -m benchmarks.suite [--output results.json] [--repeat N]
+'''
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+from importlib import metadata
+from slither import Slither
+from plugin import make_plugin
+from plugin.detectors.utils import get_all_require_statements, get_functions, is_protected
+from plugin.detectors.utils.all_expression_helpers import explore_functions
+from benchmarks.generator import fixture_name, parameter_grid
+from benchmarks.build_fixtures import FIXTURES_DIR, fixture_path
+
+def all_functions(slither: Slither):
+    return [function for contract in slither.contracts for function in contract.functions]
+
+HELPERS = {
+    'get_functions': lambda slither: [get_functions(contract) for contract in slither.contracts],
+    'explore_functions': lambda slither: [explore_functions(function) for function in all_functions(slither)],
+    'get_all_require_statements': lambda slither: [get_all_require_statements(function) for function in all_functions(slither)],
+    'is_protected': lambda slither: [is_protected(function) for function in all_functions(slither)],
+}
+
+def load_fixture(parameters: dict) -> Slither:
+    # sources are resolved relative to the fixtures directory
+    cwd = os.getcwd()
+    os.chdir(FIXTURES_DIR)
+
+    try:
+        return Slither(os.path.basename(fixture_path(parameters)))
+    finally:
+        os.chdir(cwd)
+
+def run_detector(detector_class, slither: Slither):
+    return [list(detector_class(compilation_unit, slither, None)._detect()) for compilation_unit in slither.compilation_units]
+
+# returns the fastest of repeat runs of measured, each run on a freshly loaded fixture
+# slither caches expressions on its functions and the plugin keeps its analysis index in the slither context, a fresh instance drops both
+def measure(parameters: dict, measured, repeat: int) -> float:
+    timings = []
+
+    for _ in range(repeat):
+        slither = load_fixture(parameters)
+
+        start = time.perf_counter()
+        measured(slither)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+def bench_fixture(parameters: dict, repeat: int) -> dict:
+    start = time.perf_counter()
+    load_fixture(parameters)
+    timings = {'load': time.perf_counter() - start}
+
+    for detector_class in make_plugin()[0]:
+        timings[f'detector:{detector_class.ARGUMENT}'] = measure(parameters, lambda slither: run_detector(detector_class, slither), repeat)
+
+    for name, helper in HELPERS.items():
+        timings[f'helper:{name}'] = measure(parameters, helper, repeat)
+
+    return {'fixture': fixture_name(parameters), 'parameters': parameters, 'seconds': timings}
+
+def package_version(package: str) -> str:
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return None
+
+def main(output: str, repeat: int):
+    results = []
+
+    missing = [fixture_path(parameters) for parameters in parameter_grid() if not os.path.isfile(fixture_path(parameters))]
+
+    if missing:
+        print('Missing fixtures, rebuild them with python3 -m benchmarks.build_fixtures:\n' + '\n'.join(missing), file=sys.stderr)
+        sys.exit(1)
+
+    for parameters in parameter_grid():
+        result = bench_fixture(parameters, repeat)
+        results.append(result)
+
+        print(f'{result["fixture"]:<60} {sum(result["seconds"].values()):>10.4f}s')
+
+    report = {
+        'python': platform.python_version(),
+        'slither': package_version('slither-analyzer'),
+        'repeat': repeat,
+        'results': results,
+    }
+
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+def parse_args():
+    parser = argparse.ArgumentParser(prog='python3 -m benchmarks.suite', description='Times the detectors and utils helpers on the benchmark fixtures.')
+    parser.add_argument('--output', default='benchmark-results.json', help='json file the timings are written to (default: benchmark-results.json)')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per measurement, the fastest is reported (default: 3)')
+
+    return parser.parse_args()
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    main(args.output, args.repeat)
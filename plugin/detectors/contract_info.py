@@ -1,7 +1,10 @@
-from slither.detectors.abstract_detector import AbstractDetector, DetectorClassification
-from plugin.detectors.utils import is_deployable, is_overriden
+from slither.detectors.abstract_detector import DetectorClassification
+from slither.core.declarations.contract import Contract
+from plugin.detectors.utils import is_deployable, get_coverage_matrix
+from plugin.detectors.utils.findings import Finding, contract_finding
+from plugin.detectors.utils.pattern_detector import PatternDetector
 
-class ContractInfo(AbstractDetector):
+class ContractInfo(PatternDetector):
     '''
     Documentation
     '''
@@ -18,19 +21,15 @@ class ContractInfo(AbstractDetector):
     WIKI_EXPLOIT_SCENARIO = 'wiki scenario'
     WIKI_RECOMMENDATION = 'wiki rec'
 
-    def _detect(self):
-        info = []
-        
-        for contract in filter(lambda c: is_deployable(c), self.slither.contracts):
-            funcs = list(filter(lambda func: not func.is_constructor and not is_overriden(func), contract.functions))
-            public_funcs = list(filter(lambda func: func.visibility in ('public', 'external'), funcs))
+    def analyzed_contracts(self) -> list[Contract]:
+        return list(filter(lambda c: is_deployable(c), self.slither.contracts))
 
-            info.append(f'DETECTOR INFO: Contract {contract.name} has {len(funcs)} functions. {len(public_funcs)} of them are public.\n\n')
+    def detect_contract(self, contract: Contract):
+        matrix = get_coverage_matrix(contract)
+        funcs = len(matrix.functions)
+        public_funcs = matrix.public.bit_count()
 
-        res = self.generate_result(info)
+        yield contract_finding(contract, functions=funcs, public_functions=public_funcs)
 
-        if info:
-            return [res]
-        
-        return []
-    
\ No newline at end of file
+    def render(self, finding: Finding):
+        return f'DETECTOR INFO: Contract {finding.contract} has {finding.fields["functions"]} functions. {finding.fields["public_functions"]} of them are public.\n\n'
@@ -1,12 +1,13 @@
-from slither.detectors.abstract_detector import AbstractDetector, DetectorClassification
+from slither.detectors.abstract_detector import DetectorClassification
 from slither.core.declarations.contract import Contract
 from slither.core.declarations.modifier import Modifier
-from slither.core.expressions.expression import Expression
 from slither.core.solidity_types.elementary_type import ElementaryType
 from slither.core.variables.state_variable import StateVariable
-from plugin.detectors.utils import get_all_require_statements, is_protected, require_deep_condition, get_function_signiture, is_overriden
+from plugin.detectors.utils import get_all_require_statements, require_deep_source, get_function_signiture, get_coverage_matrix
+from plugin.detectors.utils.findings import Finding, contract_finding
+from plugin.detectors.utils.pattern_detector import PatternDetector
 
-class EmergencyStopPattern(AbstractDetector):
+class EmergencyStopPattern(PatternDetector):
     '''
     Documentation
     '''
@@ -28,15 +29,6 @@ class EmergencyStopPattern(AbstractDetector):
 
         return list(filter(lambda modifier_state_var_pair: modifier_state_var_pair[1] is not None, modifier_state_var_pairs))
     
-    # helper for deep condition. assigns state variable to assignment_obj if expression is a state variable of type bool to be accessed later.
-    def deep_cond_helper(self, expression: Expression, assignment_obj: dict):
-        result = isinstance(expression, StateVariable) and isinstance(expression.type, ElementaryType) and expression.type == ElementaryType('bool')
-
-        if result:
-            assignment_obj['state_var'] = expression
-
-        return result
-
     # returns isStopped state variable name if modifier is a stop modifier
     def is_modifier_stop_modifier(self, modifier: Modifier):
         expressions = get_all_require_statements(modifier)
@@ -44,52 +36,48 @@ class EmergencyStopPattern(AbstractDetector):
         if len(expressions) != 1:
             return None
         
-        state_var_dict = {}
-
-        if require_deep_condition(expressions[0], lambda x: self.deep_cond_helper(x, state_var_dict), modifier):
-            return state_var_dict['state_var']
-        
-        return None
+        return require_deep_source(expressions[0], stop_state_condition, modifier)
     
     def check_stop_modifier_application(self, contract: Contract, potential_stop_modifiers: list[tuple[Modifier, StateVariable]]):
         return list(filter(lambda modifier: self.is_stop_modifier_applied_everywhere(contract, modifier[0]), potential_stop_modifiers))
 
     def is_stop_modifier_applied_everywhere(self, contract: Contract, modifier: Modifier):
-        public_mutable_functions = list(filter(lambda function: not function.is_constructor and function.visibility in ('public', 'external') and not function.pure and not function.view and not is_overriden(function), contract.functions))
+        matrix = get_coverage_matrix(contract)
 
         # if no public mutable functions, return false
-        if not public_mutable_functions:
+        if not matrix.public_mutable:
             return False
 
         # Set threshold for how many functions must be protected by stop modifier out of all public functions. Set 1 for all.
         THRESHOLD = 0.5
 
-        stopable_funcs = list(filter(lambda function: modifier in function.modifiers, public_mutable_functions))
-        guarded_non_stopable_funcs = list(filter(lambda function: modifier not in function.modifiers and is_protected(function), public_mutable_functions))
+        stopable_funcs = matrix.public_mutable & matrix.applied(modifier)
+        guarded_non_stopable_funcs = matrix.public_mutable & ~matrix.applied(modifier) & matrix.protected
 
         # if |stopable_funcs| / (|all_functions| - |guarded_non_stopable_funcs|) >= THRESHOLD, return true
         try:
-            return len(stopable_funcs) / (len(public_mutable_functions) - len(guarded_non_stopable_funcs)) >= THRESHOLD
+            return stopable_funcs.bit_count() / (matrix.public_mutable.bit_count() - guarded_non_stopable_funcs.bit_count()) >= THRESHOLD
         except ZeroDivisionError:
-            return len(stopable_funcs) > 0
+            return stopable_funcs.bit_count() > 0
     
-    def _detect(self):
-        info = []
-        
-        for contract in self.slither.contracts:
-            potential_stop_modifiers = self.check_for_stop_modifiers(contract)
-            stop_modifiers = self.check_stop_modifier_application(contract, potential_stop_modifiers)
-            for modifier, state_var in stop_modifiers:
-                no_stop_functions = list(filter(lambda function: modifier not in function.modifiers and not function.is_constructor and not is_overriden(function) and not function.pure and not function.view and function.visibility in ('public', 'external'), contract.functions))
-                if no_stop_functions:
-                    info.append(f'DETECTOR INFO: Emergency Stop Pattern detected in Contract {contract.name}.\nModifier {modifier.name} implements this pattern using state variable {contract.name}.{state_var.name}.\nThe following public mutable functions are not guarded by emergency stop modifier: {", ".join([get_function_signiture(func) for func in no_stop_functions])}\n\n')
-                else:
-                    info.append(f'DETECTOR INFO: Emergency Stop Pattern detected in Contract {contract.name}.\nModifier {modifier.name} implements this pattern using state variable {contract.name}.{state_var.name}.\n\n')
+    def detect_contract(self, contract: Contract):
+        potential_stop_modifiers = self.check_for_stop_modifiers(contract)
+        stop_modifiers = self.check_stop_modifier_application(contract, potential_stop_modifiers)
+        matrix = get_coverage_matrix(contract)
 
+        for modifier, state_var in stop_modifiers:
+            no_stop_functions = matrix.functions_in(matrix.public_mutable & ~matrix.applied(modifier))
+            stop_functions = matrix.functions_in(matrix.public_mutable & matrix.applied(modifier))
 
-        res = self.generate_result(info)
+            yield contract_finding(contract, modifier=modifier.name, state_variable=state_var.name, unstoppable_functions=[get_function_signiture(func) for func in no_stop_functions], stoppable_functions=[get_function_signiture(func) for func in stop_functions])
 
-        if info:
-            return [res]
-        
-        return []
\ No newline at end of file
+    def render(self, finding: Finding):
+        text = f'DETECTOR INFO: Emergency Stop Pattern detected in Contract {finding.contract}.\nModifier {finding.fields["modifier"]} implements this pattern using state variable {finding.contract}.{finding.fields["state_variable"]}.\n'
+
+        if finding.fields['unstoppable_functions']:
+            text += f'The following public mutable functions are not guarded by emergency stop modifier: {", ".join(finding.fields["unstoppable_functions"])}\n'
+
+        return text + '\n'
+
+def stop_state_condition(x):
+    return isinstance(x, StateVariable) and isinstance(x.type, ElementaryType) and x.type == ElementaryType('bool')
@@ -1,11 +1,12 @@
-from slither.detectors.abstract_detector import AbstractDetector, DetectorClassification
+from slither.detectors.abstract_detector import DetectorClassification
 from slither.core.declarations.contract import Contract
 from slither.core.declarations.function_contract import FunctionContract
-from slither.core.expressions.member_access import MemberAccess
-from slither.core.expressions.call_expression import CallExpression
-from plugin.detectors.utils import get_external_contracts, get_function_signiture, is_overriden
+from slither.visitors.expression.find_calls import FindCalls
+from plugin.detectors.utils import get_external_contract_functions, external_call_variable, get_function_signiture, get_functions, is_public
+from plugin.detectors.utils.findings import Finding, contract_finding
+from plugin.detectors.utils.pattern_detector import PatternDetector
 
-class FacadePattern(AbstractDetector):
+class FacadePattern(PatternDetector):
     '''
     Documentation
     '''
@@ -22,27 +23,34 @@ class FacadePattern(AbstractDetector):
     WIKI_EXPLOIT_SCENARIO = 'wiki scenario'
     WIKI_RECOMMENDATION = 'wiki rec'
     
+    # true if the function itself makes more than one call through external contract state variables
+    # calls made by its callees are not counted, a function calling a facade is not a facade itself
     def check_for_chained_calls(self, function: FunctionContract):
-        exContracts = get_external_contracts(function.contract)
+        external_variables = get_external_contract_functions(function.contract)
 
-        calls = filter(lambda ex: isinstance(ex, CallExpression) and isinstance(ex.called, MemberAccess) and any(map(lambda exContract: str(ex).startswith(exContract[1]), exContracts)), function.expressions)
+        if not external_variables:
+            return False
 
-        return len(list(calls)) > 1
+        call_sites = set()
 
-    def _detect(self):
-        info = []
-        
-        for contract in self.slither.contracts:
-            for function in filter(lambda f: not is_overriden(f), contract.functions):
-                if self.check_for_chained_calls(function):
-                    if function.visibility in ('public', 'external'):
-                        info.append(f'DETECTOR WARNING: Chained external calls detected in {function.visibility} function {get_function_signiture(function)}.\nConsider the use of a facade pattern to isolate external calls for better error handling and the reduction of likelyhood of catastrophic failure.\n\n')
-                    else:
-                        info.append(f'DETECTOR INFO: Facade pattern detected in {function.visibility} function {get_function_signiture(function)}.\n\n')
+        # calls are found within assignments, conditions and arguments as well, e.g. x = oracle.query() or require(oracle.ready())
+        for ex in function.expressions:
+            for call in FindCalls(ex).result():
+                if external_call_variable(call, external_variables) is not None:
+                    call_sites.add(id(call))
 
-        res = self.generate_result(info)
+                    if len(call_sites) > 1:
+                        return True
 
-        if info:
-            return [res]
-        
-        return []
\ No newline at end of file
+        return False
+
+    def detect_contract(self, contract: Contract):
+        for function in get_functions(contract):
+            if self.check_for_chained_calls(function):
+                yield contract_finding(contract, function=get_function_signiture(function), visibility=function.visibility, warning=is_public(function))
+
+    def render(self, finding: Finding):
+        if finding.fields['warning']:
+            return f'DETECTOR WARNING: Chained external calls detected in {finding.fields["visibility"]} function {finding.fields["function"]}.\nConsider the use of a facade pattern to isolate external calls for better error handling and the reduction of likelyhood of catastrophic failure.\n\n'
+
+        return f'DETECTOR INFO: Facade pattern detected in {finding.fields["visibility"]} function {finding.fields["function"]}.\n\n'
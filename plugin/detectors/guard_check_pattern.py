@@ -1,12 +1,15 @@
-from slither.detectors.abstract_detector import AbstractDetector, DetectorClassification
+from slither.detectors.abstract_detector import DetectorClassification
+from slither.core.declarations.contract import Contract
 from slither.core.declarations.function_contract import FunctionContract
 from slither.core.expressions.identifier import Identifier
 from slither.core.declarations.solidity_variables import SolidityVariableComposed
 from slither.core.variables.state_variable import StateVariable
 from slither.core.variables.local_variable import LocalVariable
-from plugin.detectors.utils import get_all_require_statements, is_deployable, require_deep_condition, get_function_signiture, is_overriden
+from plugin.detectors.utils import get_all_require_statements, is_deployable, is_public, require_deep_condition, get_function_signiture, get_functions
+from plugin.detectors.utils.findings import Finding, contract_finding
+from plugin.detectors.utils.pattern_detector import PatternDetector
 
-class GuardCheckPattern(AbstractDetector):
+class GuardCheckPattern(PatternDetector):
     '''
     Documentation
     '''
@@ -37,7 +40,7 @@ class GuardCheckPattern(AbstractDetector):
 
         require_statements = get_all_require_statements(function)
 
-        return list(filter(lambda req_statement: require_deep_condition(req_statement, lambda x: isinstance(x, StateVariable), function), require_statements))
+        return list(filter(lambda req_statement: require_deep_condition(req_statement, state_guard_condition, function), require_statements))
     
     def check_for_arg_guard(self, function: FunctionContract):
         if function.is_constructor:
@@ -45,45 +48,47 @@ class GuardCheckPattern(AbstractDetector):
         
         require_statements = get_all_require_statements(function)
 
-        return list(filter(lambda req_statement: require_deep_condition(req_statement, lambda x: isinstance(x, LocalVariable) and x.name in [param.name for param in function.parameters], function), require_statements))
+        return list(filter(lambda req_statement: require_deep_condition(req_statement, input_guard_condition, function), require_statements))
 
-    def _detect(self):
-        info = []
-        
-        for contract in self.slither.contracts:
-            for func in filter(lambda f: not f.is_constructor and not is_overriden(f), contract.functions):
+    def detect_contract(self, contract: Contract):
+        for func in filter(lambda f: not f.is_constructor, get_functions(contract)):
 
-                auth_guards = self.check_for_auth_guard(func)
-                state_guards = self.check_for_state_guard(func)
-                arg_guards = self.check_for_arg_guard(func)
+            auth_guards = self.check_for_auth_guard(func)
+            state_guards = self.check_for_state_guard(func)
+            arg_guards = self.check_for_arg_guard(func)
 
-                has_guards = bool(auth_guards or state_guards or arg_guards)
+            has_guards = bool(auth_guards or state_guards or arg_guards)
+            unguarded = not has_guards and is_public(func) and is_deployable(func.contract)
 
-                info.append(f'DETECTOR INFO: Function {get_function_signiture(func)} has {len(auth_guards) if auth_guards else 0} Auth Guard Patterns, {len(state_guards) if state_guards else 0} State Guard Patterns and {len(arg_guards) if arg_guards else 0} Input Guard Patterns.\n\n')
+            # the guard expressions are only part of the text report
+            expressions = {'Auth': [str(ex) for ex in auth_guards or []], 'State': [str(ex) for ex in state_guards or []], 'Input': [str(ex) for ex in arg_guards or []]}
 
-                if auth_guards:
-                    info.append(f'DETECTOR INFO: Auth Guard Pattern detected in function {get_function_signiture(func)}.\nExpressions implementing this pattern: {", ".join([str(ex) for ex in auth_guards])}\n\n')
+            yield contract_finding(contract, expressions, function=get_function_signiture(func), visibility=func.visibility, auth_guards=len(auth_guards) if auth_guards else 0, state_guards=len(state_guards) if state_guards else 0, input_guards=len(arg_guards) if arg_guards else 0, unguarded=unguarded)
 
-                if state_guards:
-                    info.append(f'DETECTOR INFO: State Guard Pattern detected in function {get_function_signiture(func)}.\nExpressions implementing this pattern: {", ".join([str(ex) for ex in state_guards])}\n\n')
+    def render(self, finding: Finding):
+        function = finding.fields['function']
+        text = f'DETECTOR INFO: Function {function} has {finding.fields["auth_guards"]} Auth Guard Patterns, {finding.fields["state_guards"]} State Guard Patterns and {finding.fields["input_guards"]} Input Guard Patterns.\n\n'
 
-                if arg_guards:
-                    info.append(f'DETECTOR INFO: Input Guard Pattern detected in function {get_function_signiture(func)}.\nExpressions implementing this pattern: {", ".join([str(ex) for ex in arg_guards])}\n\n')
+        for kind, expressions in finding.details.items():
+            if expressions:
+                text += f'DETECTOR INFO: {kind} Guard Pattern detected in function {function}.\nExpressions implementing this pattern: {", ".join(expressions)}\n\n'
 
-                if not has_guards and func.visibility in ('public', 'external') and is_deployable(func.contract):
-                    info.append(f'DETECTOR WARNING: No Guard Patterns detected in {func.visibility} function {get_function_signiture(func)}.\n\n')
+        if finding.fields['unguarded']:
+            text += f'DETECTOR WARNING: No Guard Patterns detected in {finding.fields["visibility"]} function {function}.\n\n'
 
-        res = self.generate_result(info)
+        return text
 
-        if info:
-            return [res]
-        
-        return []
-    
 
 def auth_guard_condition(x):
     if isinstance(x, Identifier):
         return x.value.name == 'msg.sender'
     elif isinstance(x, SolidityVariableComposed):
         return x.name == 'msg.sender'
-    return False
\ No newline at end of file
+    return False
+
+def state_guard_condition(x):
+    return isinstance(x, StateVariable)
+
+# parameters are resolved in the function the require is evaluated in, so this matches its own parameters
+def input_guard_condition(x):
+    return isinstance(x, LocalVariable) and x.function is not None and x in x.function.parameters
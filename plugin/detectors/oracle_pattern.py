@@ -1,13 +1,13 @@
-from slither.detectors.abstract_detector import AbstractDetector, DetectorClassification
+from slither.detectors.abstract_detector import DetectorClassification
 from slither.core.declarations.contract import Contract
-from slither.core.declarations.function_contract import FunctionContract
-from slither.core.expressions.member_access import MemberAccess
-from slither.core.expressions.call_expression import CallExpression
+from slither.core.solidity_types.user_defined_type import UserDefinedType
 from slither.core.variables.state_variable import StateVariable
-from plugin.detectors.utils import get_all_require_statements, is_protected, get_external_contracts, safe_all_expressions, require_deep_condition, get_function_signiture
+from plugin.detectors.utils import get_all_require_statements, is_protected, is_public, get_external_contracts, get_external_contract_functions, external_call_variable, safe_all_expressions, require_deep_condition, get_function_signiture
+from plugin.detectors.utils.findings import Finding, contract_finding
+from plugin.detectors.utils.pattern_detector import PatternDetector
 from plugin.detectors.guard_check_pattern import auth_guard_condition
 
-class OraclePattern(AbstractDetector):
+class OraclePattern(PatternDetector):
     '''
     Documentation
     '''
@@ -29,35 +29,35 @@ class OraclePattern(AbstractDetector):
 
 
         
-    def has_oracle_invocation_function(self, contract: Contract, potential_oracles: list[tuple[Contract, str]]):
+    def has_oracle_invocation_function(self, contract: Contract):
         """
-        Check if the contract has a function that invokes a function of another contract
+        Check if the contract has a function that invokes a function of another contract through one of its state variables
         """
+        oracle_functions = get_external_contract_functions(contract)
+
         for func in filter(lambda func: not func.is_constructor, contract.functions):
             for exp in safe_all_expressions(func):
-                if isinstance(exp, CallExpression):
-                    if isinstance(exp.called, MemberAccess):
-                        flatten_functions: list[tuple[FunctionContract, Contract, str]] = []
+                variable = external_call_variable(exp, oracle_functions)
+
+                if variable is None:
+                    continue
 
-                        for contract, contractVariable in potential_oracles:
-                            for function in contract.functions:
-                                flatten_functions.append((function, contract, contractVariable))
+                oracle_contract, functions = oracle_functions[variable]
 
-                        for function, contract, contractVariable in flatten_functions:
-                            if function.name == exp.called.member_name and function.contract == contract:
-                                return function, contract, contractVariable
+                if exp.called.member_name in functions:
+                    return functions[exp.called.member_name], oracle_contract, variable
 
         return None
     
-    def has_oracle_callback_function(self, contract: Contract, potential_oracles: list[tuple[Contract, str]]):
+    def has_oracle_callback_function(self, contract: Contract):
         """
         Check if the contract has a function is protected to be invoked by oracle contract
         """
-        for func in filter(lambda func: not func.is_constructor and func.visibility in ['public', 'external'] and not func.pure and not func.view and not func.payable and len(func.parameters) > 0, contract.functions):
+        for func in filter(lambda func: not func.is_constructor and is_public(func) and not func.pure and not func.view and not func.payable and len(func.parameters) > 0, contract.functions):
             if is_protected(func):
                 for ex in get_all_require_statements(func):
                     if require_deep_condition(ex, auth_guard_condition, func):
-                        if require_deep_condition(ex, lambda arg: isinstance(arg, StateVariable) and arg.name in map(lambda x: x[1], potential_oracles), func) or self.check_for_popular_callback_names(func.name):
+                        if require_deep_condition(ex, oracle_variable_condition, func) or self.check_for_popular_callback_names(func.name):
                            return func
 
 
@@ -74,23 +74,23 @@ class OraclePattern(AbstractDetector):
             
 
 
-    def _detect(self):
-        info = []
-
+    def analyzed_contracts(self) -> list[Contract]:
         if(not self.check_num_contracts()):
             return []
-        
-        for contract in self.slither.contracts:
-            potential_oracles = get_external_contracts(contract)
-            if potential_oracles:
-                invocation = self.has_oracle_invocation_function(contract, potential_oracles)
-                callback = self.has_oracle_callback_function(contract, potential_oracles)
-                if invocation and callback:
-                    info.append(f'DETECTOR INFO: Contract {contract.name} implements the oracle pattern.\nOracle contract: {invocation[1].name}, oracle state variable: {contract.name}.{invocation[2]}\nCallback function: {get_function_signiture(callback)}\n\n')
-
-        res = self.generate_result(info)
-
-        if info:
-            return [res]
-        
-        return []
\ No newline at end of file
+
+        return self.slither.contracts
+
+    def detect_contract(self, contract: Contract):
+        potential_oracles = get_external_contracts(contract)
+        if potential_oracles:
+            invocation = self.has_oracle_invocation_function(contract)
+            callback = self.has_oracle_callback_function(contract)
+            if invocation and callback:
+                yield contract_finding(contract, oracle_contract=invocation[1].name, oracle_variable=invocation[2], callback=get_function_signiture(callback))
+
+    def render(self, finding: Finding):
+        return f'DETECTOR INFO: Contract {finding.contract} implements the oracle pattern.\nOracle contract: {finding.fields["oracle_contract"]}, oracle state variable: {finding.contract}.{finding.fields["oracle_variable"]}\nCallback function: {finding.fields["callback"]}\n\n'
+
+# state variables are resolved in the contract of the function the require is evaluated in, so this matches its own external contract variables
+def oracle_variable_condition(x):
+    return isinstance(x, StateVariable) and isinstance(x.type, UserDefinedType) and isinstance(x.type.type, Contract)
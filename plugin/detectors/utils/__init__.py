@@ -11,76 +11,199 @@ from slither.core.variables.state_variable import StateVariable
 from slither.core.variables.local_variable import LocalVariable
 from slither.core.declarations.solidity_variables import SolidityVariableComposed
 from slither.core.expressions.identifier import Identifier
+from slither.core.expressions.member_access import MemberAccess
 from plugin.detectors.utils.deep_condition_helpers import DeepCondition
 from plugin.detectors.utils.all_expression_helpers import explore_functions
+from plugin.detectors.utils.analysis_index import AnalysisIndex, get_analysis_index
+from plugin.detectors.utils.dataflow import get_condition_sources
+from plugin.detectors.utils.override_helpers import OverrideTable
+from plugin.detectors.utils.coverage_matrix import CoverageMatrix
+from plugin.detectors.utils.profiling import count, profiled, record_cache
 from typing import Callable
 
+def analysis_index(declaration: Function | Contract) -> AnalysisIndex:
+    return get_analysis_index(declaration.compilation_unit.core)
+
+@profiled('get_all_require_statements')
 def get_all_require_statements(function: FunctionContract) -> list[CallExpression]:
-    return list(filter(lambda f: isinstance(f, CallExpression) and str(f).startswith('require'), safe_all_expressions(function)))
+    index = analysis_index(function)
+    record_cache('require_statements', function in index.require_statements)
+
+    if function not in index.require_statements:
+        index.require_statements[function] = list(filter(lambda f: isinstance(f, CallExpression) and str(f).startswith('require'), safe_all_expressions(function)))
+
+    return index.require_statements[function]
 
 def is_protected(function: FunctionContract):
     if function.is_constructor:
         return False
 
-    require_statements = get_all_require_statements(function)
+    index = analysis_index(function)
+    record_cache('protected', function in index.protected)
+
+    if function not in index.protected:
+        require_statements = get_all_require_statements(function)
+
+        index.protected[function] = any(map(lambda require_statement: require_deep_condition(require_statement, msg_sender_condition, function), require_statements))
+
+    return index.protected[function]
 
-    cond = DeepCondition(lambda x: (isinstance(x, SolidityVariableComposed) or isinstance(x, Identifier)) and str(x) == 'msg.sender', function)
-    return any(map(lambda require_statement: cond.does_expression_satisfy_condition(require_statement.arguments[0]), require_statements))
+# conditions are module level functions, so results memoized by DeepCondition are shared between calls
+def msg_sender_condition(x):
+    return (isinstance(x, SolidityVariableComposed) or isinstance(x, Identifier)) and str(x) == 'msg.sender'
+
+def is_public(function: FunctionContract):
+    index = analysis_index(function)
+
+    if function not in index.public:
+        index.public[function] = function.visibility in ('public', 'external')
+
+    return index.public[function]
 
 def get_external_contracts(contract: Contract) -> list[tuple[Contract, str]]:
+    index = analysis_index(contract)
+
+    if contract in index.external_contracts:
+        return index.external_contracts[contract]
+
     exContracts = []
 
     for state_var in contract.state_variables_ordered:
         if isinstance(state_var.type, UserDefinedType) and isinstance(state_var.type.type, Contract):
             exContracts.append((state_var.type.type, state_var.name))
-        
+
+    index.external_contracts[contract] = exContracts
     return exContracts
 
+def get_external_contract_functions(contract: Contract) -> dict[str, tuple[Contract, dict[str, FunctionContract]]]:
+    '''
+    Maps the name of every state variable of contract type to the contract and its functions by name.
+    '''
+    index = analysis_index(contract)
+
+    if contract in index.external_contract_functions:
+        return index.external_contract_functions[contract]
+
+    table = {}
+
+    for exContract, variable_name in get_external_contracts(contract):
+        functions = {}
+        for function in exContract.functions:
+            functions.setdefault(function.name, function)
+
+        table.setdefault(variable_name, (exContract, functions))
+
+    index.external_contract_functions[contract] = table
+    return table
+
+def external_call_variable(expression: Expression, external_variables: dict[str, tuple[Contract, dict[str, FunctionContract]]]) -> str | None:
+    '''
+    Returns the name of the state variable an external call such as oracle.query(x) is made through, if it is one of external_variables.
+    Matches the receiver of the call structurally, without rendering the expression.
+    '''
+    if not isinstance(expression, CallExpression) or not isinstance(expression.called, MemberAccess):
+        return None
+
+    receiver = expression.called.expression
+
+    if not isinstance(receiver, Identifier) or not isinstance(receiver.value, StateVariable) or receiver.value.name not in external_variables:
+        return None
+
+    return receiver.value.name
+
 def require_deep_condition(require_expression: CallExpression, condition: Callable[[Identifier | LocalVariable | StateVariable | SolidityVariableComposed], bool], context_function: FunctionContract):
+    sources = get_condition_sources(require_expression, context_function)
+    if sources is not None:
+        return any(map(condition, sources))
+
     cond = DeepCondition(condition, context_function)
 
     return cond.does_expression_satisfy_condition(require_expression.arguments[0])
 
+# returns the first variable the condition of require_expression depends on that satisfies condition, or None
+def require_deep_source(require_expression: CallExpression, condition: Callable[[Identifier | LocalVariable | StateVariable | SolidityVariableComposed], bool], context_function: FunctionContract):
+    sources = get_condition_sources(require_expression, context_function)
+    if sources is not None:
+        return next(filter(condition, sources), None)
+
+    cond = DeepCondition(condition, context_function, memoize=False)
+    cond.does_expression_satisfy_condition(require_expression.arguments[0])
+
+    return cond.satisfying
+
 def deep_condition(expression: Expression, condition: Callable[[Identifier | LocalVariable | StateVariable | SolidityVariableComposed], bool], context_function: FunctionContract):
+    sources = get_condition_sources(expression, context_function)
+    if sources is not None:
+        return any(map(condition, sources))
+
     cond = DeepCondition(condition, context_function)
 
     return cond.does_expression_satisfy_condition(expression)
 
+@profiled('safe_all_expressions')
 def safe_all_expressions(function: Function):
+    index = analysis_index(function)
+    record_cache('all_expressions', function in index.all_expressions)
+
+    if function in index.all_expressions:
+        return index.all_expressions[function]
+
     try:
         # Official implementations
         # This implementation is faster than our own
-        return function.all_expressions()
+        exps = function.all_expressions()
     except:
         # Use our own implementation as fallback
         # Official implementation crashes if type Literal (unhashable type) is used due to the use of sets for deduplication
+        count('safe_all_expressions:fallback')
         exps = explore_functions(function)
         function._all_expressions = exps
-        return exps
+
+    index.all_expressions[function] = exps
+    return exps
     
 def get_function_signiture(function: FunctionContract):
     return f'{function.contract.name}.{function.name}({", ".join([f"{param.type} {param.name}" for param in function.parameters])})'
 
-def find_fist_parent_that_declares_function(function: FunctionContract, start_contract: Contract):
-    queue = [start_contract]
-    queue.extend(start_contract.inheritance)
+def get_override_table(contract: Contract) -> OverrideTable:
+    index = analysis_index(contract)
 
-    for contract in queue:
-        if function.name in map(lambda f: f.name, filter(lambda f: f.is_declared_by(contract), contract.functions)):
-            return contract
-    
-    return None
+    if contract not in index.override_tables:
+        index.override_tables[contract] = OverrideTable(contract)
+
+    return index.override_tables[contract]
 
+def find_fist_parent_that_declares_function(function: FunctionContract, start_contract: Contract):
+    return get_override_table(start_contract).first_declarer(function)
+
+@profiled('is_overriden')
 def is_overriden(function: FunctionContract):
-    if function.is_declared_by(function.contract):
-        return False
-    
-    if len(list(filter(lambda f: f.full_name == function.full_name, function.contract.functions))) == 1:
-        return False
+    index = analysis_index(function)
+    record_cache('overriden', function in index.overriden)
+
+    if function not in index.overriden:
+        index.overriden[function] = get_override_table(function.contract).is_overriden(function)
+
+    return index.overriden[function]
+
+def get_functions(contract: Contract) -> list[FunctionContract]:
+    '''
+    Returns the functions of the contract, leaving out inherited functions that are overriden.
+    '''
+    index = analysis_index(contract)
+
+    if contract not in index.functions:
+        index.functions[contract] = list(filter(lambda f: not is_overriden(f), contract.functions))
+
+    return index.functions[contract]
+
+def get_coverage_matrix(contract: Contract) -> CoverageMatrix:
+    index = analysis_index(contract)
 
-    first_declarer = find_fist_parent_that_declares_function(function, function.contract)
+    if contract not in index.coverage_matrices:
+        index.coverage_matrices[contract] = CoverageMatrix(list(filter(lambda f: not f.is_constructor, get_functions(contract))), is_public, is_protected)
 
-    return first_declarer and function.contract_declarer.name != first_declarer.name
+    return index.coverage_matrices[contract]
 
 def is_deployable(contract: Contract):
     return not contract.is_interface and not contract.is_library and contract.is_fully_implemented
@@ -1,39 +1,81 @@
+from collections import deque
 from slither.core.declarations.function import Function
+from slither.core.expressions.expression import Expression
+from plugin.detectors.utils.analysis_index import get_analysis_index
+from plugin.detectors.utils.profiling import record_cache
 
-def explore_functions(function: Function):
-        values = function.expressions
-        explored = [function]
-        to_explore = [
-            c for c in function.internal_calls if isinstance(c, Function) and c not in explored
-        ]
-        to_explore += [
-            c for (_, c) in function.library_calls if isinstance(c, Function) and c not in explored
-        ]
-        to_explore += [m for m in function.modifiers if m not in explored]
-
-        while to_explore:
-            f = to_explore[0]
-            to_explore = to_explore[1:]
-            if f in explored:
-                continue
-            explored.append(f)
-
-            values += f.expressions
-
-            to_explore += [
-                c
-                for c in f.internal_calls
-                if isinstance(c, Function) and c not in explored and c not in to_explore
-            ]
-            to_explore += [
-                c
-                for (_, c) in f.library_calls
-                if isinstance(c, Function) and c not in explored and c not in to_explore
-            ]
-            to_explore += [m for m in f.modifiers if m not in explored and m not in to_explore]
-
-        # Remove duplicates
-        # Even though this method is fairly slow, it works on unhashable types
-        res = []
-        [res.append(x) for x in values if x not in res]
-        return res
\ No newline at end of file
+def get_callees(function: Function) -> list[Function]:
+    callees = [c for c in function.internal_calls if isinstance(c, Function)]
+    callees += [c for (_, c) in function.library_calls if isinstance(c, Function)]
+    callees += [m for m in function.modifiers if isinstance(m, Function)]
+
+    return callees
+
+def explore_function_closure(function: Function, closures: dict[Function, list[Function]]) -> list[Function]:
+    '''
+    Returns the function and every function reachable from it through internal calls, library calls and modifiers.
+    Closures of the function and of its direct callees are memoized in closures, so callees shared by many functions are expanded once.
+    '''
+    record_cache('closures', function in closures)
+
+    if function in closures:
+        return closures[function]
+
+    explored = {function}
+    closure = [function]
+
+    for callee in get_callees(function):
+        if callee in explored:
+            continue
+
+        if callee not in closures:
+            closures[callee] = breadth_first_closure(callee, closures)
+
+        for reachable in closures[callee]:
+            if reachable not in explored:
+                explored.add(reachable)
+                closure.append(reachable)
+
+    closures[function] = closure
+    return closure
+
+def breadth_first_closure(function: Function, closures: dict[Function, list[Function]]) -> list[Function]:
+    explored = {function}
+    closure = [function]
+    to_explore = deque(get_callees(function))
+
+    while to_explore:
+        f = to_explore.popleft()
+        if f in explored:
+            continue
+
+        # the closure of f is complete, so nothing reachable from f has to be expanded
+        if f in closures:
+            for reachable in closures[f]:
+                if reachable not in explored:
+                    explored.add(reachable)
+                    closure.append(reachable)
+            continue
+
+        explored.add(f)
+        closure.append(f)
+
+        to_explore.extend(get_callees(f))
+
+    return closure
+
+def explore_functions(function: Function, closures: dict[Function, list[Function]] = None) -> list[Expression]:
+    if closures is None:
+        closures = get_analysis_index(function.compilation_unit.core).closures
+
+    values = []
+
+    # Remove duplicates by identity, which also works on unhashable types such as Literal
+    seen = set()
+    for f in explore_function_closure(function, closures):
+        for expression in f.expressions:
+            if id(expression) not in seen:
+                seen.add(id(expression))
+                values.append(expression)
+
+    return values
@@ -0,0 +1,65 @@
+import os
+from slither.core.slither_core import SlitherCore
+
+ANALYSIS_INDEX_KEY = 'sdp-analysis-index'
+
+# 'ast' (default) walks the expressions of every require statement with DeepCondition
+# 'slithir' answers from a dependency analysis over SlithIR computed once per function
+CONDITION_BACKEND_ENV = 'SDP_CONDITION_BACKEND'
+
+class AnalysisIndex:
+    '''
+    Facts about functions and contracts that are shared by all detectors of the plugin.
+    Every table is filled lazily by the helpers in plugin.detectors.utils, so each fact is computed once per slither run.
+    '''
+
+    def __init__(self):
+        self.condition_backend = os.environ.get(CONDITION_BACKEND_ENV, 'ast')
+
+        # function -> list of expressions, including modifiers and internal calls
+        self.all_expressions = {}
+        # function -> list of functions reachable through internal calls, library calls and modifiers
+        self.closures = {}
+        # function -> list of require call expressions
+        self.require_statements = {}
+        # function -> bool
+        self.protected = {}
+        # function -> bool
+        self.overriden = {}
+        # contract -> OverrideTable
+        self.override_tables = {}
+        # function -> bool, True for public and external functions
+        self.public = {}
+        # contract -> list of functions that are not overriden
+        self.functions = {}
+        # contract -> CoverageMatrix of its functions that are not overriden
+        self.coverage_matrices = {}
+        # contract -> list of (contract, state variable name) pairs
+        self.external_contracts = {}
+        # contract -> {state variable name -> (contract, {function name -> function})}
+        self.external_contract_functions = {}
+        # function -> LocalContext used by DeepCondition
+        self.local_contexts = {}
+        # function -> FunctionDataflow, only used by the slithir condition backend
+        self.dataflows = {}
+        # id(require statement or its condition) -> FunctionDataflow of the function declaring it
+        self.condition_dataflows = {}
+        # (id(require statement or its condition), context function) -> tuple of sources the condition depends on in the context function
+        self.condition_sources = {}
+        # context function -> parameter of a reachable function -> sources passed to it, see dataflow.get_parameter_sources
+        self.parameter_sources = {}
+        # contract -> fingerprint of its normalized source, see contract_memo
+        self.fingerprints = {}
+        # ContractMemo shared by all detectors, if enabled
+        self.contract_memo = None
+        # detector argument -> contract -> findings of detect_contract, if contracts are detected in parallel
+        self.parallel_results = None
+
+def get_analysis_index(slither: SlitherCore) -> AnalysisIndex:
+    index = slither.context.get(ANALYSIS_INDEX_KEY)
+
+    if index is None:
+        index = AnalysisIndex()
+        slither.context[ANALYSIS_INDEX_KEY] = index
+
+    return index
@@ -0,0 +1,152 @@
+import os
+import re
+import json
+import hashlib
+import sqlite3
+from slither.core.declarations.contract import Contract
+from slither.core.declarations.function_top_level import FunctionTopLevel
+from slither.core.slither_core import SlitherCore
+from slither.core.solidity_types.user_defined_type import UserDefinedType
+from plugin.detectors.utils.analysis_index import get_analysis_index
+from plugin.detectors.utils.all_expression_helpers import explore_function_closure
+from plugin.detectors.utils.findings import Finding
+
+# path of a sqlite database memoizing detector output per contract fingerprint, shared between runs
+CONTRACT_MEMO_ENV = 'SDP_CONTRACT_MEMO'
+
+# part of the memo key. The detector version already changes with the sources of the detectors, this file included, bump it for changes outside of them, e.g. a slither upgrade changing findings
+MEMO_FORMAT = 'findings-2'
+
+DETECTORS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# runs of whitespace and comments, replaced by a single space
+WHITESPACE_AND_COMMENTS_REGEX = re.compile(r'(?:\s|//[^\n]*|/\*.*?\*/)+', re.S)
+PRAGMA_REGEX = re.compile(r'pragma\s[^;]*;')
+
+def normalize_source(source: str) -> str:
+    source = PRAGMA_REGEX.sub(' ', source)
+
+    return WHITESPACE_AND_COMMENTS_REGEX.sub(' ', source).strip()
+
+def get_source_hash(declaration: Contract | FunctionTopLevel) -> str:
+    return hashlib.sha256(normalize_source(declaration.source_mapping.content).encode()).hexdigest()
+
+def get_referenced_contracts(contract: Contract) -> list[Contract]:
+    '''
+    Contracts whose code, other than inherited code, the detectors look at when analyzing contract:
+    types of contract state variables and libraries called by its functions.
+    '''
+    referenced = {}
+
+    for state_var in contract.state_variables_ordered:
+        if isinstance(state_var.type, UserDefinedType) and isinstance(state_var.type.type, Contract):
+            referenced.setdefault(state_var.type.type.name, state_var.type.type)
+
+    for function in contract.functions:
+        for library, _ in function.library_calls:
+            referenced.setdefault(library.name, library)
+
+    return [referenced[name] for name in sorted(referenced)]
+
+def get_free_functions(contract: Contract) -> list[FunctionTopLevel]:
+    '''
+    Functions declared outside of contracts that the functions and modifiers of contract reach through calls, they are not part of any contract source.
+    '''
+    closures = get_analysis_index(contract.compilation_unit.core).closures
+    free_functions = set()
+
+    for function in contract.functions + contract.modifiers:
+        free_functions.update(filter(lambda reachable: isinstance(reachable, FunctionTopLevel), explore_function_closure(function, closures)))
+
+    return list(free_functions)
+
+def get_contract_fingerprint(contract: Contract) -> str:
+    '''
+    Hash of the normalized sources, without comments, whitespace and pragmas, of the contract, of every contract reachable from it through inheritance and references and of the free functions they call,
+    together with the inheritance, reference and call edges between them. Contracts referencing each other are covered as well, so equal fingerprints mean equal detector output.
+    '''
+    fingerprints = get_analysis_index(contract.compilation_unit.core).fingerprints
+
+    if contract in fingerprints:
+        return fingerprints[contract]
+
+    reached = {contract}
+    to_explore = [contract]
+
+    while to_explore:
+        current = to_explore.pop()
+
+        for other in current.inheritance + get_referenced_contracts(current):
+            if other not in reached:
+                reached.add(other)
+                to_explore.append(other)
+
+    # contracts and free functions are identified by name and source hash, names alone are not unique within a compilation unit
+    ids = {other: f'{other.name}:{get_source_hash(other)}' for other in reached}
+    free_functions = {other: sorted(f'{function.canonical_name}:{get_source_hash(function)}' for function in get_free_functions(other)) for other in reached}
+
+    fingerprint = hashlib.sha256()
+    fingerprint.update(ids[contract].encode())
+
+    for other in sorted(reached, key=lambda other: ids[other]):
+        edges = [ids[other], [ids[parent] for parent in other.inheritance], [ids[referenced] for referenced in get_referenced_contracts(other)], free_functions[other]]
+        fingerprint.update(json.dumps(edges).encode())
+
+    fingerprints[contract] = fingerprint.hexdigest()
+    return fingerprints[contract]
+
+def get_detector_version(condition_backend: str) -> str:
+    '''
+    Hash of the memo format, the condition backend and the sources of the detectors, changes whenever the findings of the detectors may change.
+    '''
+    version = hashlib.sha256(json.dumps([MEMO_FORMAT, condition_backend]).encode())
+
+    sources = sorted(os.path.join(root, file) for root, dirs, files in os.walk(DETECTORS_DIR) for file in files if file.endswith('.py'))
+
+    for source in sources:
+        version.update(os.path.relpath(source, DETECTORS_DIR).encode())
+
+        with open(source, 'rb') as f:
+            version.update(hashlib.sha256(f.read()).digest())
+
+    return version.hexdigest()
+
+class ContractMemo:
+    '''
+    Persistent memo of the findings every detector reported for a contract fingerprint.
+    Entries are keyed by the detector version, so findings of other detector sources or another condition backend are never served.
+    '''
+
+    def __init__(self, path: str, version: str):
+        self.version = version
+
+        # several slither processes may share the database, wait for their writes instead of failing
+        self.connection = sqlite3.connect(path, timeout=60)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('CREATE TABLE IF NOT EXISTS memoized_findings (version TEXT, detector TEXT, fingerprint TEXT, findings TEXT, PRIMARY KEY (version, detector, fingerprint))')
+        self.connection.commit()
+
+    def get(self, detector: str, fingerprint: str) -> list[Finding] | None:
+        row = self.connection.execute('SELECT findings FROM memoized_findings WHERE version = ? AND detector = ? AND fingerprint = ?', (self.version, detector, fingerprint)).fetchone()
+
+        if row is None:
+            return None
+
+        return [Finding(*finding) for finding in json.loads(row[0])]
+
+    def put(self, detector: str, fingerprint: str, findings: list[Finding]):
+        self.connection.execute('INSERT OR REPLACE INTO memoized_findings VALUES (?, ?, ?, ?)', (self.version, detector, fingerprint, json.dumps([finding.to_row() for finding in findings])))
+        self.connection.commit()
+
+def get_contract_memo(slither: SlitherCore) -> ContractMemo | None:
+    path = os.environ.get(CONTRACT_MEMO_ENV)
+
+    if not path:
+        return None
+
+    index = get_analysis_index(slither)
+
+    if index.contract_memo is None:
+        index.contract_memo = ContractMemo(path, get_detector_version(index.condition_backend))
+
+    return index.contract_memo
@@ -0,0 +1,56 @@
+from slither.core.declarations.function_contract import FunctionContract
+from typing import Callable
+
+class CoverageMatrix:
+    '''
+    Function x modifier matrix of a contract, built in a single pass over its functions.
+    Rows are the non constructor functions of the contract, every column is a bitset with bit i set if column applies to function i.
+    '''
+
+    def __init__(self, functions: list[FunctionContract], is_public: Callable[[FunctionContract], bool], is_protected: Callable[[FunctionContract], bool]):
+        self.functions = functions
+        self.is_protected = is_protected
+
+        self.all = (1 << len(functions)) - 1
+        self.public = 0
+        self.mutable = 0
+        # modifier -> functions the modifier is applied to
+        self.modifiers = {}
+
+        for i, function in enumerate(functions):
+            bit = 1 << i
+
+            if is_public(function):
+                self.public |= bit
+
+            if not function.pure and not function.view:
+                self.mutable |= bit
+
+            for modifier in function.modifiers:
+                self.modifiers[modifier] = self.modifiers.get(modifier, 0) | bit
+
+        self.public_mutable = self.public & self.mutable
+        self._protected = None
+
+    # public mutable functions guarded by a msg.sender check, computed on first use since only contracts with stop modifier candidates need it
+    @property
+    def protected(self) -> int:
+        if self._protected is not None:
+            return self._protected
+
+        self._protected = 0
+        for i in self.rows(self.public_mutable):
+            if self.is_protected(self.functions[i]):
+                self._protected |= 1 << i
+
+        return self._protected
+
+    def applied(self, modifier) -> int:
+        return self.modifiers.get(modifier, 0)
+
+    # indices of the functions in bits, in the order of the functions of the contract
+    def rows(self, bits: int) -> list[int]:
+        return [i for i in range(len(self.functions)) if bits >> i & 1]
+
+    def functions_in(self, bits: int) -> list[FunctionContract]:
+        return [self.functions[i] for i in self.rows(bits)]
@@ -0,0 +1,226 @@
+from slither.core.declarations.function import Function
+from slither.core.declarations.solidity_variables import SolidityVariable
+from slither.core.expressions.call_expression import CallExpression
+from slither.core.expressions.expression import Expression
+from slither.core.variables.local_variable import LocalVariable
+from slither.core.variables.state_variable import StateVariable
+from slither.slithir.operations import InternalCall, LibraryCall, OperationWithLValue, Return, SolidityCall, TypeConversion
+from slither.slithir.variables import ReferenceVariable
+from plugin.detectors.utils.analysis_index import AnalysisIndex, get_analysis_index
+from plugin.detectors.utils.all_expression_helpers import explore_function_closure
+
+def is_source(variable) -> bool:
+    return isinstance(variable, (SolidityVariable, StateVariable, LocalVariable))
+
+def is_require(operation) -> bool:
+    return isinstance(operation, SolidityCall) and operation.function.name.startswith('require(')
+
+class FunctionDataflow:
+    '''
+    Flow insensitive dependency analysis of a single function over SlithIR.
+    Records for every variable the sources it depends on: solidity variables such as msg.sender, state variables and local variables, including parameters.
+    Sources are kept in dicts used as ordered sets, so conditions are always evaluated in the same order.
+    Like the expression walk of DeepCondition, type conversions are not looked through.
+    '''
+
+    def __init__(self, function: Function, dataflows: dict[Function, 'FunctionDataflow']):
+        self.function = function
+        # variable -> sources
+        self.dependencies = {}
+        # sources of the values returned by the function
+        self.return_sources = {}
+        # id(require call expression) and id(its condition expression) -> tuple of sources of the condition, in terms of the parameters of this function
+        self.condition_sources = {}
+        # internal and library calls, whose arguments are passed to the parameters of the callee
+        self.calls = []
+
+        self.analyze(dataflows)
+
+    def sources(self, variable) -> dict:
+        result = {variable: None} if is_source(variable) else {}
+        result.update(self.dependencies.get(variable, {}))
+
+        return result
+
+    # sources of the value returned by an internal call, with parameters of the callee replaced by the sources of the arguments
+    def call_sources(self, operation: InternalCall, dataflows: dict[Function, 'FunctionDataflow']) -> dict:
+        callee = dataflows.get(operation.function)
+        result = {}
+
+        # callee is part of a recursive cycle that is still being analyzed
+        if callee is None:
+            for read in operation.read:
+                result.update(self.sources(read))
+            return result
+
+        parameters = operation.function.parameters
+
+        for source in callee.return_sources:
+            if source in parameters and parameters.index(source) < len(operation.arguments):
+                result.update(self.sources(operation.arguments[parameters.index(source)]))
+            else:
+                result[source] = None
+
+        return result
+
+    def analyze(self, dataflows: dict[Function, 'FunctionDataflow']):
+        operations = [operation for node in self.function.nodes for operation in node.irs]
+        self.calls = [operation for operation in operations if isinstance(operation, (InternalCall, LibraryCall)) and isinstance(operation.function, Function)]
+
+        # propagate until no dependency set grows anymore
+        changed = True
+        while changed:
+            changed = False
+
+            for operation in operations:
+                if not isinstance(operation, OperationWithLValue) or operation.lvalue is None:
+                    continue
+
+                if isinstance(operation, InternalCall) and isinstance(operation.function, Function):
+                    sources = self.call_sources(operation, dataflows)
+                # opaque, as in the expression backend
+                elif isinstance(operation, TypeConversion):
+                    sources = {}
+                else:
+                    sources = {}
+                    for read in operation.read:
+                        sources.update(self.sources(read))
+
+                targets = [operation.lvalue]
+
+                # writing through a reference, e.g. x[i] = y, also writes the referenced local variable
+                if isinstance(operation.lvalue, ReferenceVariable) and isinstance(operation.lvalue.points_to_origin, LocalVariable):
+                    targets.append(operation.lvalue.points_to_origin)
+
+                for target in targets:
+                    dependencies = self.dependencies.setdefault(target, {})
+                    size = len(dependencies)
+                    dependencies.update(sources)
+                    changed = changed or len(dependencies) != size
+
+        for operation in filter(lambda operation: isinstance(operation, Return), operations):
+            for value in operation.values:
+                self.return_sources.update(self.sources(value))
+
+        for variable in self.function.returns:
+            self.return_sources.update(self.sources(variable))
+
+        for node in self.function.nodes:
+            if not isinstance(node.expression, CallExpression) or not str(node.expression).startswith('require'):
+                continue
+
+            for operation in filter(is_require, node.irs):
+                sources = tuple(self.sources(operation.arguments[0]))
+
+                self.condition_sources[id(node.expression)] = sources
+                self.condition_sources[id(node.expression.arguments[0])] = sources
+                break
+
+def get_dataflow(function: Function, index: AnalysisIndex) -> FunctionDataflow:
+    if function in index.dataflows:
+        return index.dataflows[function]
+
+    # analyze callees before their callers, iteratively so deep call chains do not hit the recursion limit
+    stack = [(function, False)]
+    on_stack = set()
+
+    while stack:
+        f, callees_done = stack.pop()
+
+        if f in index.dataflows:
+            continue
+
+        if callees_done:
+            dataflow = FunctionDataflow(f, index.dataflows)
+            index.dataflows[f] = dataflow
+            index.condition_dataflows.update(dict.fromkeys(dataflow.condition_sources, dataflow))
+            continue
+
+        if f in on_stack:
+            continue
+
+        on_stack.add(f)
+        stack.append((f, True))
+
+        for callee in f.internal_calls:
+            if isinstance(callee, Function) and callee not in index.dataflows and callee not in on_stack:
+                stack.append((callee, False))
+
+    return index.dataflows[function]
+
+# sources with the parameters of called functions replaced by the sources passed to them
+def substitute_parameters(sources, parameter_sources: dict) -> dict:
+    result = {}
+
+    for source in sources:
+        if source in parameter_sources:
+            result.update(parameter_sources[source])
+        else:
+            result[source] = None
+
+    return result
+
+def get_parameter_sources(context_function: Function, index: AnalysisIndex) -> dict:
+    '''
+    Returns parameter -> sources of the arguments passed to it, for the parameters of every function reachable from context_function but context_function itself.
+    Sources are in terms of context_function, arguments that are parameters of a caller are replaced by what the caller was passed in turn.
+    '''
+    if context_function in index.parameter_sources:
+        return index.parameter_sources[context_function]
+
+    functions = explore_function_closure(context_function, index.closures)
+    parameter_sources = {parameter: {} for function in functions if function is not context_function for parameter in function.parameters}
+
+    # propagate through chains of calls until no parameter gets new sources anymore
+    changed = True
+    while changed:
+        changed = False
+
+        for function in functions:
+            dataflow = get_dataflow(function, index)
+
+            for operation in dataflow.calls:
+                for parameter, argument in zip(operation.function.parameters, operation.arguments):
+                    if parameter not in parameter_sources:
+                        continue
+
+                    sources = parameter_sources[parameter]
+                    size = len(sources)
+                    sources.update(substitute_parameters(dataflow.sources(argument), parameter_sources))
+                    changed = changed or len(sources) != size
+
+    index.parameter_sources[context_function] = parameter_sources
+    return parameter_sources
+
+def get_condition_sources(expression: Expression, context_function: Function) -> tuple | None:
+    '''
+    Returns the sources a require statement, or the condition of a require statement, depends on when evaluated in context_function.
+    Parameters of the function declaring a reached require statement are replaced by the sources of the arguments context_function passes down to it.
+    Returns None if the SlithIR backend is disabled or the expression is not a require statement reachable from context_function.
+    '''
+    index = get_analysis_index(context_function.compilation_unit.core)
+
+    if index.condition_backend != 'slithir':
+        return None
+
+    key = (id(expression), context_function)
+
+    if key in index.condition_sources:
+        return index.condition_sources[key]
+
+    if id(expression) not in index.condition_dataflows:
+        for function in explore_function_closure(context_function, index.closures):
+            get_dataflow(function, index)
+
+    dataflow = index.condition_dataflows.get(id(expression))
+
+    if dataflow is None:
+        return None
+
+    sources = dataflow.condition_sources[id(expression)]
+
+    if dataflow.function is not context_function:
+        sources = tuple(substitute_parameters(sources, get_parameter_sources(context_function, index)))
+
+    index.condition_sources[key] = sources
+    return sources
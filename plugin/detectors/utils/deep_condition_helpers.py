@@ -7,23 +7,58 @@ from slither.core.expressions.binary_operation import BinaryOperation
 from slither.core.expressions.unary_operation import UnaryOperation
 from slither.core.variables.state_variable import StateVariable
 from slither.core.variables.local_variable import LocalVariable
+from plugin.detectors.utils.analysis_index import get_analysis_index
+from plugin.detectors.utils.profiling import profiled, profiler
 from typing import Callable
 
 class LocalContext:
+    '''
+    Name lookup tables of a function, shared by all conditions evaluated in the function.
+    '''
+
     def __init__(self, function: FunctionContract):
         self.state_variables = function.contract.state_variables_ordered
         self.local_variables = function.local_variables
         self.function_parameters = function.parameters
         self.contract_functions = function.contract.functions
 
-# condition is a function that takes in expression and returns a boolean
+        # name -> variable. State variables shadow local variables, which shadow parameters
+        self.variables = {}
+        for variable in self.state_variables + self.local_variables + self.function_parameters:
+            self.variables.setdefault(variable.name, variable)
+
+        # name -> first function of the contract with that name
+        self.functions = {}
+        for function in self.contract_functions:
+            self.functions.setdefault(function.name, function)
+
+        # (id(expression), condition) -> result of DeepCondition.recursive_iteration
+        self.results = {}
+
+def get_local_context(function: FunctionContract) -> LocalContext:
+    local_contexts = get_analysis_index(function.compilation_unit.core).local_contexts
+
+    if function not in local_contexts:
+        local_contexts[function] = LocalContext(function)
+
+    return local_contexts[function]
+
+# condition is a module level function that takes in expression and returns a boolean
+# without memoize results are not shared through the local context, so satisfying is set even if the result was computed before
 class DeepCondition:
     _context: LocalContext = None
 
-    def __init__(self, condition: Callable[[Identifier | LocalVariable | StateVariable], bool], context_function: FunctionContract):
+    def __init__(self, condition: Callable[[Identifier | LocalVariable | StateVariable], bool], context_function: FunctionContract, memoize: bool = True):
         self._context_function = context_function
         self.condition = condition
+        self.memoize = memoize
+        # first expression found to satisfy the condition
+        self.satisfying = None
+        # ids of expressions on the current recursion path, used to cut off cycles through initializers and return values
+        self._visiting = set()
+        self._cutoffs = 0
 
+    @profiled('deep_condition')
     def does_expression_satisfy_condition(self, expression: Expression):
         return self.recursive_iteration(expression)
         
@@ -31,6 +66,36 @@ class DeepCondition:
         if expression is None:
             return False
 
+        key = (id(expression), self.condition)
+        results = self.context.results
+
+        if profiler is not None:
+            profiler.count('deep_condition:visits')
+            profiler.count('deep_condition_results:hit' if key in results else 'deep_condition_results:miss')
+            profiler.maximum('deep_condition:depth', len(self._visiting) + 1)
+
+        if self.memoize and key in results:
+            return results[key]
+
+        if id(expression) in self._visiting:
+            self._cutoffs += 1
+            return False
+
+        cutoffs = self._cutoffs
+        self._visiting.add(id(expression))
+
+        try:
+            result = self.iterate(expression)
+        finally:
+            self._visiting.discard(id(expression))
+
+        # a negative result that relied on a cut off cycle is only valid on the current path
+        if self.memoize and (result or cutoffs == self._cutoffs):
+            results[key] = result
+
+        return result
+
+    def iterate(self, expression: Expression):
         if isinstance(expression, UnaryOperation):
             return self.recursive_iteration(expression.expression)
         if isinstance(expression, BinaryOperation):
@@ -53,22 +118,31 @@ class DeepCondition:
         variable = self.get_variable_from_identifier(expression)
 
         if variable is None:
-            return self.condition(expression)
+            return self.satisfies(expression)
             
         return self.recursive_iteration(variable)
     
     def recursive_local_variable(self, expression: LocalVariable):
-        if self.condition(expression):
+        if self.satisfies(expression):
             return True
         
         return self.recursive_iteration(expression.expression)
     
     def recursive_state_variable(self, expression: StateVariable):
-        if self.condition(expression):
+        if self.satisfies(expression):
             return True
         
         return self.recursive_iteration(expression.expression)
     
+    def satisfies(self, expression):
+        if not self.condition(expression):
+            return False
+
+        if self.satisfying is None:
+            self.satisfying = expression
+
+        return True
+
     def recursive_call(self, expression: CallExpression):
         func = self.get_function_from_call(expression)
 
@@ -86,24 +160,12 @@ class DeepCondition:
         
 
     def build_context(self):
-        self._context = LocalContext(self._context_function)
+        self._context = get_local_context(self._context_function)
 
         return self._context
 
     def get_variable_from_identifier(self, identifier: Identifier | SolidityVariableComposed):
-        state_var = next(filter(lambda x: x.name == str(identifier), self.context.state_variables), None)
-        if state_var:
-            return state_var
-        
-        local_var = next(filter(lambda x: x.name == str(identifier), self.context.local_variables), None)
-        if local_var:
-            return local_var
-        
-        function_param = next(filter(lambda x: x.name == str(identifier), self.context.function_parameters), None)
-        if function_param:
-            return function_param
-        
-        return None
+        return self.context.variables.get(str(identifier))
     
     def get_function_from_call(self, expression: CallExpression):
-        return next(filter(lambda x: x.name == str(expression.called), self.context.contract_functions), None)
+        return self.context.functions.get(str(expression.called))
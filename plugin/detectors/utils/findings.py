@@ -0,0 +1,49 @@
+import os
+import json
+from contextlib import contextmanager
+from slither.core.declarations.contract import Contract
+
+# path of a file the detectors append their findings to, one compact json object per line
+FINDINGS_JSONL_ENV = 'SDP_FINDINGS_JSONL'
+
+class Finding:
+    '''
+    Finding of a detector about a single contract or function.
+    Fields are what the findings sink and json output report, details hold what only the text report needs on top of them.
+    '''
+
+    __slots__ = ('contract', 'file', 'fields', 'details')
+
+    def __init__(self, contract: str, file: str, fields: dict, details: dict = None):
+        self.contract = contract
+        self.file = file
+        self.fields = fields
+        self.details = details
+
+    def to_dict(self, detector: str) -> dict:
+        return {'detector': detector, 'contract': self.contract, 'file': self.file, **self.fields}
+
+    # plain representation stored in the contract memo, Finding(*finding.to_row()) restores it
+    def to_row(self) -> list:
+        return [self.contract, self.file, self.fields, self.details]
+
+# every finding names the contract and the file declaring it, so findings of a contract compiled as part of several files can be attributed once
+def contract_finding(contract: Contract, details: dict = None, **fields) -> Finding:
+    return Finding(contract.name, contract.source_mapping.filename.absolute, fields, details)
+
+# yields the opened findings sink, or None if no sink is configured and the detectors report text instead
+@contextmanager
+def open_findings_sink():
+    path = os.environ.get(FINDINGS_JSONL_ENV)
+
+    if not path:
+        yield None
+        return
+
+    with open(path, 'a') as f:
+        yield f
+
+def write_findings(sink, detector: str, findings: list[Finding]):
+    for finding in findings:
+        sink.write(json.dumps(finding.to_dict(detector), separators=(',', ':')))
+        sink.write('\n')
@@ -0,0 +1,35 @@
+from slither.core.declarations.contract import Contract
+from slither.core.declarations.function_contract import FunctionContract
+
+class OverrideTable:
+    '''
+    Declaration and override information of the functions of a contract, built in a single pass over its linearization.
+    '''
+
+    def __init__(self, contract: Contract):
+        self.contract = contract
+
+        # full name -> number of functions of the contract with that full name
+        self.full_name_counts = {}
+        for function in contract.functions:
+            self.full_name_counts[function.full_name] = self.full_name_counts.get(function.full_name, 0) + 1
+
+        # name -> first contract of the linearization that declares a function with that name
+        self.first_declarers = {}
+        for declarer in [contract] + contract.inheritance:
+            for function in declarer.functions_declared:
+                self.first_declarers.setdefault(function.name, declarer)
+
+    def first_declarer(self, function: FunctionContract) -> Contract:
+        return self.first_declarers.get(function.name)
+
+    def is_overriden(self, function: FunctionContract) -> bool:
+        if function.is_declared_by(self.contract):
+            return False
+
+        if self.full_name_counts.get(function.full_name, 0) <= 1:
+            return False
+
+        first_declarer = self.first_declarer(function)
+
+        return first_declarer is not None and function.contract_declarer.name != first_declarer.name
@@ -0,0 +1,148 @@
+import os
+import multiprocessing
+from typing import Iterator
+from slither.detectors.abstract_detector import AbstractDetector
+from slither.core.declarations.contract import Contract
+from slither.core.slither_core import SlitherCore
+from plugin.detectors.utils.analysis_index import get_analysis_index
+from plugin.detectors.utils.contract_memo import get_contract_fingerprint, get_contract_memo
+from plugin.detectors.utils.findings import Finding, open_findings_sink, write_findings
+from plugin.detectors.utils.profiling import profiler, record_cache, span
+
+# number of processes detecting contracts in parallel, forked after slither analyzed the compilation units
+DETECT_JOBS_ENV = 'SDP_DETECT_JOBS'
+
+class PatternDetector(AbstractDetector):
+    '''
+    Base class of the plugin detectors.
+    Detectors implement detect_contract, which yields the findings of a single contract, and render, which returns the text of a finding.
+    Findings are written to the findings sink as every contract is done. Without a sink every contract with findings is reported as a result of its own, rendered to text.
+    '''
+
+    def analyzed_contracts(self) -> list[Contract]:
+        return self.slither.contracts
+
+    def detect_contract(self, contract: Contract) -> Iterator[Finding]:
+        raise NotImplementedError
+
+    def render(self, finding: Finding) -> str:
+        raise NotImplementedError
+
+    # returns the findings of detect_contract, served from the contract memo if an identical contract was analyzed before
+    def memoized_detect_contract(self, contract: Contract) -> list[Finding]:
+        memo = get_contract_memo(self.slither)
+
+        if memo is None:
+            return list(self.detect_contract(contract))
+
+        fingerprint = get_contract_fingerprint(contract)
+        findings = memo.get(self.ARGUMENT, fingerprint)
+        record_cache('contract_memo', findings is not None)
+
+        if findings is not None:
+            # identical copies of the contract may live in other files
+            for finding in findings:
+                finding.file = contract.source_mapping.filename.absolute
+
+            return findings
+
+        findings = list(self.detect_contract(contract))
+        memo.put(self.ARGUMENT, fingerprint, findings)
+
+        return findings
+
+    # names are not unique across files, spans of contracts are keyed by the declaring file as well
+    def contract_span(self, contract: Contract):
+        return span(f'contract:{self.ARGUMENT}:{contract.source_mapping.filename.absolute}:{contract.name}')
+
+    # with a sink the findings of every contract are written as it is done, no results are built. Otherwise slither collects the results of all contracts
+    def _detect(self):
+        with span(f'detector:{self.ARGUMENT}'), open_findings_sink() as sink:
+            parallel_results = get_parallel_results(self.slither)
+            # detectors not registered with slither are not run in parallel
+            results = parallel_results.get(self.ARGUMENT) if parallel_results is not None else None
+
+            for contract in self.analyzed_contracts():
+                if results is not None:
+                    findings = results[contract]
+                else:
+                    with self.contract_span(contract):
+                        findings = self.memoized_detect_contract(contract)
+
+                if sink is not None:
+                    write_findings(sink, self.ARGUMENT, findings)
+                elif findings:
+                    yield self.generate_result([self.render(finding) for finding in findings])
+
+# state of the parent process, inherited by the forked workers: the detectors, the contracts to detect and the contracts every detector analyzes
+_parallel_state = None
+
+def reset_worker():
+    slither, _, _, _ = _parallel_state
+
+    # the sqlite connection of the parent must not be used after fork, every worker opens its own
+    get_analysis_index(slither).contract_memo = None
+
+    # the profile of the parent up to the fork is written by the parent
+    if profiler is not None:
+        profiler.reset()
+
+# workers exit without writing their profile, the profile of every contract is returned with its findings and merged by the parent
+def detect_contract_in_worker(contract_index: int) -> tuple[dict[str, list[Finding]], dict | None]:
+    _, detectors, contracts, analyzed = _parallel_state
+    contract = contracts[contract_index]
+    results = {}
+
+    for detector in filter(lambda detector: contract in analyzed[detector.ARGUMENT], detectors):
+        with detector.contract_span(contract):
+            results[detector.ARGUMENT] = detector.memoized_detect_contract(contract)
+
+    return results, profiler.take() if profiler is not None else None
+
+def detect_in_parallel(slither: SlitherCore, jobs: int) -> dict[str, dict[Contract, list[Finding]]]:
+    '''
+    Runs all registered plugin detectors on every contract, one contract per task on a pool of forked workers sharing the analyzed compilation units copy-on-write.
+    Returns detector argument -> contract -> findings of detect_contract. Outputs are collected in contract order, so the reports do not depend on scheduling.
+    '''
+    global _parallel_state
+
+    # one instance per detector, slither registers a detector once per compilation unit
+    detectors = {}
+    for detector in filter(lambda detector: isinstance(detector, PatternDetector), slither.detectors):
+        detectors.setdefault(detector.ARGUMENT, detector)
+
+    analyzed = {argument: set(detector.analyzed_contracts()) for argument, detector in detectors.items()}
+    contracts = list(filter(lambda contract: any(contract in analyzed_contracts for analyzed_contracts in analyzed.values()), slither.contracts))
+
+    _parallel_state = (slither, list(detectors.values()), contracts, analyzed)
+
+    try:
+        with multiprocessing.get_context('fork').Pool(jobs, initializer=reset_worker) as pool:
+            outputs = pool.map(detect_contract_in_worker, range(len(contracts)), chunksize=1)
+    finally:
+        _parallel_state = None
+
+    results = {argument: {} for argument in detectors}
+    for contract, (output, profile) in zip(contracts, outputs):
+        for argument, result in output.items():
+            results[argument][contract] = result
+
+        if profile is not None:
+            profiler.merge(profile)
+
+    return results
+
+# returns the outputs of detect_in_parallel, computed by the first detector that runs, or None if parallel detection is disabled
+def get_parallel_results(slither: SlitherCore) -> dict[str, dict[Contract, list[Finding]]] | None:
+    jobs = int(os.environ.get(DETECT_JOBS_ENV) or 1)
+
+    if jobs < 2:
+        return None
+
+    index = get_analysis_index(slither)
+
+    if index.parallel_results is None:
+        with span('detect_in_parallel'):
+            index.parallel_results = detect_in_parallel(slither, jobs)
+
+    return index.parallel_results
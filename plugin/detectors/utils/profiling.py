@@ -0,0 +1,184 @@
+import os
+import json
+import time
+import atexit
+import functools
+from contextlib import contextmanager, nullcontext
+
+# directory every slither process writes its profile to, instrumentation is enabled only if set
+PROFILE_ENV = 'SDP_PROFILE'
+
+SPEEDSCOPE_SCHEMA = 'https://www.speedscope.app/file-format-schema.json'
+
+class Profiler:
+    '''
+    Records calls and wall time per span, counters such as cache hits, and maxima such as recursion depth.
+    Time is also summed per stack of open spans as spans open and close, exported as a speedscope profile, so memory does not grow with the number of spans.
+    '''
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.start = time.perf_counter()
+        # name -> [calls, seconds]. Time of recursive spans is only counted by the outermost one
+        self.spans = {}
+        self.active = {}
+        self.counters = {}
+        self.maxima = {}
+        # name -> index of the speedscope frame
+        self.frames = {}
+        # frames of the open spans, outermost first
+        self.stack = []
+        # tuple of frames -> seconds the stack was open without a nested span open
+        self.stack_seconds = {}
+        self.last = self.start
+
+    @contextmanager
+    def span(self, name: str):
+        frame = self.frames.setdefault(name, len(self.frames))
+        stats = self.spans.setdefault(name, [0, 0])
+
+        self.active[name] = self.active.get(name, 0) + 1
+        start = time.perf_counter()
+        self.add_stack_time(start)
+        self.stack.append(frame)
+
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.add_stack_time(end)
+            self.stack.pop()
+            self.active[name] -= 1
+
+            stats[0] += 1
+            if not self.active[name]:
+                stats[1] += end - start
+
+    # adds the time since the last span opened or closed to the stack of open spans
+    def add_stack_time(self, now: float):
+        if self.stack:
+            stack = tuple(self.stack)
+            self.stack_seconds[stack] = self.stack_seconds.get(stack, 0) + now - self.last
+
+        self.last = now
+
+    def count(self, name: str, n: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def maximum(self, name: str, value: int):
+        if name not in self.maxima or value > self.maxima[name]:
+            self.maxima[name] = value
+
+    # returns what was recorded since the last reset and starts over, e.g. in a forked worker passing its profile to the parent
+    def take(self) -> dict:
+        names = list(self.frames)
+        profile = {
+            'spans': self.spans,
+            'counters': self.counters,
+            'maxima': self.maxima,
+            'stack_seconds': {tuple(names[frame] for frame in stack): seconds for stack, seconds in self.stack_seconds.items()},
+        }
+
+        self.reset()
+        return profile
+
+    # forgets everything recorded, spans still open are not closed anymore
+    def reset(self):
+        self.spans = {}
+        self.active = {}
+        self.counters = {}
+        self.maxima = {}
+        self.stack = []
+        self.stack_seconds = {}
+        self.last = time.perf_counter()
+
+    # adds a profile returned by take, frames are matched by name
+    def merge(self, profile: dict):
+        for name, (calls, seconds) in profile['spans'].items():
+            stats = self.spans.setdefault(name, [0, 0])
+            stats[0] += calls
+            stats[1] += seconds
+
+        for name, n in profile['counters'].items():
+            self.count(name, n)
+
+        for name, value in profile['maxima'].items():
+            self.maximum(name, value)
+
+        for names, seconds in profile['stack_seconds'].items():
+            stack = tuple(self.frames.setdefault(name, len(self.frames)) for name in names)
+            self.stack_seconds[stack] = self.stack_seconds.get(stack, 0) + seconds
+
+    def hit_rates(self) -> dict[str, float]:
+        caches = {name[:-len(':hit')] for name in self.counters if name.endswith(':hit')}
+        caches |= {name[:-len(':miss')] for name in self.counters if name.endswith(':miss')}
+
+        rates = {}
+        for cache in sorted(caches):
+            hits = self.counters.get(f'{cache}:hit', 0)
+            rates[cache] = hits / (hits + self.counters.get(f'{cache}:miss', 0))
+
+        return rates
+
+    def report(self) -> dict:
+        return {
+            'spans': {name: {'calls': calls, 'seconds': seconds} for name, (calls, seconds) in self.spans.items()},
+            'counters': self.counters,
+            'maxima': self.maxima,
+            'hit_rates': self.hit_rates(),
+        }
+
+    def speedscope(self) -> dict:
+        return {
+            '$schema': SPEEDSCOPE_SCHEMA,
+            'shared': {'frames': [{'name': name} for name in self.frames]},
+            'profiles': [{
+                'type': 'sampled',
+                'name': f'slither {os.getpid()}',
+                'unit': 'seconds',
+                'startValue': 0,
+                'endValue': sum(self.stack_seconds.values()),
+                'samples': [list(stack) for stack in self.stack_seconds],
+                'weights': list(self.stack_seconds.values()),
+            }],
+        }
+
+    def write(self):
+        os.makedirs(self.directory, exist_ok=True)
+
+        with open(os.path.join(self.directory, f'profile-{os.getpid()}.json'), 'w') as f:
+            json.dump(self.report(), f)
+
+        with open(os.path.join(self.directory, f'profile-{os.getpid()}.speedscope.json'), 'w') as f:
+            json.dump(self.speedscope(), f)
+
+# decided once at import, so instrumented functions are left untouched if profiling is disabled
+profiler = Profiler(os.environ[PROFILE_ENV]) if os.environ.get(PROFILE_ENV) else None
+
+if profiler is not None:
+    atexit.register(profiler.write)
+
+def span(name: str):
+    return nullcontext() if profiler is None else profiler.span(name)
+
+def count(name: str, n: int = 1):
+    if profiler is not None:
+        profiler.count(name, n)
+
+def record_cache(cache: str, hit: bool):
+    if profiler is not None:
+        profiler.count(f'{cache}:hit' if hit else f'{cache}:miss')
+
+def profiled(name: str):
+    def decorator(function):
+        if profiler is None:
+            return function
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with profiler.span(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,159 @@
+'''
+Long running analysis server. Slither and the plugin detectors are imported once, every job only pays for compilation and analysis.
+
+Jobs and responses are json objects, one per line:
+    {"id": 1, "target": "Contract.sol", "detectors": ["guard-check"], "solc_remaps": "lib=deps/lib", "solc": "solc", "solc_version": "0.8.19", "timeout": 600}
+    {"id": 1, "status": "succeeded", "findings": [...], "error": null}
+
+Only target is required, all detectors run if detectors is missing. solc_version selects the compiler of solc-select. Status is one of succeeded, failed, timeout and memory.
+The server reads jobs from stdin and answers on stdout, or listens on a unix socket if started with --socket.
+In socket mode every connection is handled by a forked child, so jobs run in parallel and do not share slither state.
+'''
+
+import os
+import sys
+import json
+import signal
+import resource
+import argparse
+import tempfile
+import socketserver
+from slither import Slither
+from plugin import make_plugin
+from plugin.detectors.utils.findings import FINDINGS_JSONL_ENV
+from plugin.detectors.utils.profiling import profiler
+
+DETECTORS = {detector.ARGUMENT: detector for detector in make_plugin()[0]}
+
+class JobTimeout(Exception):
+    pass
+
+def raise_timeout(signum, frame):
+    raise JobTimeout()
+
+def analyze(job: dict) -> dict:
+    response = {'id': job.get('id'), 'status': 'failed', 'findings': [], 'error': None}
+
+    # the detectors stream their findings to a file of their own for every job instead of building text results
+    fd, findings_path = tempfile.mkstemp(suffix='.jsonl')
+    os.close(fd)
+    os.environ[FINDINGS_JSONL_ENV] = findings_path
+
+    signal.signal(signal.SIGALRM, raise_timeout)
+    signal.alarm(job.get('timeout') or 0)
+
+    try:
+        detectors = [DETECTORS[argument] for argument in job.get('detectors', DETECTORS)]
+
+        kwargs = {}
+        if job.get('solc_remaps'):
+            kwargs['solc_remaps'] = job['solc_remaps']
+        if job.get('solc'):
+            kwargs['solc'] = job['solc']
+
+        # read by the solc wrapper of solc-select
+        if job.get('solc_version'):
+            os.environ['SOLC_VERSION'] = job['solc_version']
+        else:
+            os.environ.pop('SOLC_VERSION', None)
+
+        slither = Slither(job['target'], **kwargs)
+
+        for detector in detectors:
+            slither.register_detector(detector)
+
+        slither.run_detectors()
+
+        with open(findings_path) as f:
+            response['findings'] = [json.loads(line) for line in f]
+
+        response['status'] = 'succeeded'
+    except JobTimeout:
+        response['findings'] = []
+        response['status'] = 'timeout'
+    except MemoryError:
+        response['findings'] = []
+        response['status'] = 'memory'
+    except Exception as e:
+        response['error'] = f'{type(e).__name__}: {e}'
+    finally:
+        signal.alarm(0)
+        os.remove(findings_path)
+
+    return response
+
+def handle_jobs(input, output):
+    for line in input:
+        if not line.strip():
+            continue
+
+        try:
+            job = json.loads(line)
+
+            if not isinstance(job, dict):
+                raise ValueError('jobs are json objects')
+
+            response = analyze(job)
+        except ValueError as e:
+            response = {'id': None, 'status': 'failed', 'findings': [], 'error': f'Invalid job: {e}'}
+
+        output.write(json.dumps(response, separators=(',', ':')) + '\n')
+        output.flush()
+
+def limit_memory(memory_limit: int):
+    if memory_limit:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+class JobHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        # runs in the child forked for the connection, the limit does not apply to the server itself
+        limit_memory(self.server.memory_limit)
+
+        handle_jobs(self.rfile, self.wfile)
+
+        # forked children exit without running atexit handlers
+        if profiler is not None:
+            profiler.write()
+
+    def setup(self):
+        super().setup()
+
+        # json is read and written as text
+        self.rfile = self.connection.makefile('r')
+        self.wfile = self.connection.makefile('w')
+
+class AnalysisServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    memory_limit: int = None
+
+def serve(socket_path: str = None, memory_limit: int = None):
+    if socket_path is None:
+        limit_memory(memory_limit)
+        handle_jobs(sys.stdin, sys.stdout)
+        return
+
+    # socket left behind by a server that did not shut down cleanly
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+
+    with AnalysisServer(socket_path, JobHandler) as server:
+        server.memory_limit = memory_limit
+
+        try:
+            server.serve_forever()
+        finally:
+            os.remove(socket_path)
+
+def parse_args():
+    parser = argparse.ArgumentParser(prog='python -m plugin.server', description='Runs the design pattern detectors on analysis jobs read from stdin or a unix socket.')
+    parser.add_argument('--socket', default=None, help='path of a unix socket to listen on instead of reading jobs from stdin')
+    parser.add_argument('--memory-limit', type=int, default=None, help='maximum address space of a process analyzing jobs in MB (default: no limit)')
+
+    return parser.parse_args()
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    try:
+        serve(args.socket, args.memory_limit * 1024 * 1024 if args.memory_limit else None)
+    except KeyboardInterrupt:
+        pass
@@ -6,8 +6,8 @@ setup(
     url="https://github.com/trailofbits/slither-plugins",
     author="Trail of Bits",
     version="0.0",
-    packages=find_packages(),
-    python_requires=">=3.8",
+    packages=find_packages(exclude=['benchmarks*', 'tests*']),
+    python_requires=">=3.10",
     install_requires=["slither-analyzer==0.9.3"],
     entry_points={
         "slither_analyzer.plugin": "slither sdp-analysis=plugin:make_plugin",
@@ -0,0 +1,70 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+contract Oracle {
+    uint256 internal latest;
+
+    function price(uint256 id) external returns (uint256) {
+        return id + latest;
+    }
+
+    function request(uint256 id) external {
+        latest = id;
+    }
+}
+
+function double(uint256 x) pure returns (uint256) {
+    return x * 2;
+}
+
+contract Owned {
+    address internal owner;
+
+    constructor() {
+        owner = msg.sender;
+    }
+
+    modifier onlyOwner() {
+        require(msg.sender == owner);
+        _;
+    }
+}
+
+contract Vault is Owned {
+    bool internal stopped;
+    uint256 internal total;
+    Oracle internal oracle;
+
+    modifier whenNotStopped() {
+        require(!stopped);
+        _;
+    }
+
+    function stop() public onlyOwner {
+        stopped = true;
+    }
+
+    function deposit(uint256 amount) public whenNotStopped {
+        require(amount > 0);
+        total += double(amount);
+    }
+
+    function withdraw(uint256 amount) public whenNotStopped onlyOwner {
+        require(amount <= total);
+        total -= amount;
+    }
+
+    function refresh(uint256 id) public whenNotStopped {
+        oracle.request(id);
+        oracle.price(id);
+    }
+
+    function sync() public {
+        total = 0;
+    }
+
+    function callback(uint256 value) public {
+        require(msg.sender == address(oracle));
+        total = value;
+    }
+}
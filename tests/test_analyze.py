@@ -0,0 +1,282 @@
+import os
+import sys
+import json
+import sqlite3
+import zipfile
+import subprocess
+import pytest
+from importlib.machinery import SourceFileLoader
+from importlib.util import spec_from_loader, module_from_spec
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ANALYZE_PATH = os.path.join(ROOT, 'scripts', 'analyze')
+FAKE_SOLC = os.path.join(ROOT, 'tests', 'fake-solc')
+
+# stands in for slither: every line "//@ <json>" of the target is a finding, "//! fail" fails the run and "//! crash" kills the worker of scripts/analyze running it
+STUB_SLITHER = '''#! {python}
+import os
+import sys
+import json
+import signal
+
+target = sys.argv[1]
+detectors = sys.argv[sys.argv.index('--detect') + 1].split(',')
+
+with open(os.environ['STUB_SLITHER_LOG'], 'a') as f:
+    f.write(json.dumps([os.path.basename(target), detectors]) + '\\n')
+
+with open(target) as f:
+    text = f.read()
+
+if '//! crash' in text:
+    # the first ancestor running scripts/analyze is the worker, the shell in between may have been replaced by this process
+    pid = os.getppid()
+    while 'analyze' not in open(f'/proc/{{pid}}/cmdline').read():
+        pid = int(open(f'/proc/{{pid}}/stat').read().rsplit(')', 1)[1].split()[1])
+    os.kill(pid, signal.SIGKILL)
+
+if '//! fail' in text:
+    sys.stderr.write('Error: compilation failed\\n')
+    sys.exit(1)
+
+with open(os.environ['SDP_FINDINGS_JSONL'], 'a') as f:
+    for line in text.splitlines():
+        if line.startswith('//@ ') and json.loads(line[4:])['detector'] in detectors:
+            f.write(json.dumps({{**json.loads(line[4:]), 'file': os.path.abspath(target)}}) + '\\n')
+
+sys.stderr.write(f'{{target}} analyzed (1 contracts with {{len(detectors)}} detectors)\\n')
+'''
+
+# scripts/analyze has no .py suffix, it is loaded explicitly
+def load_analyze():
+    loader = SourceFileLoader('analyze', ANALYZE_PATH)
+    module = module_from_spec(spec_from_loader('analyze', loader))
+    loader.exec_module(module)
+    return module
+
+analyze = load_analyze()
+
+def write(path, text: str) -> str:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return os.path.normpath(str(path))
+
+@pytest.mark.parametrize('version, pragma, expected', [
+    ('0.8.19', '^0.8.0', True),
+    ('0.9.0', '^0.8.0', False),
+    ('0.8.0', '^0.8.1', False),
+    ('0.7.6', '~0.7.0', True),
+    ('0.8.0', '~0.7.0', False),
+    ('0.8.19', '>=0.6.0 <0.9.0', True),
+    ('0.5.17', '>=0.6.0 <0.9.0', False),
+    ('0.9.0', '>=0.6.0 <0.9.0', False),
+    ('0.6.12', '0.6.12', True),
+    ('0.6.11', '=0.6.12', False),
+    ('0.8.4', '0.8', True),
+    ('0.7.6', '^0.6.0 || ^0.7.0', True),
+    ('0.8.0', '^0.6.0 || ^0.7.0', False),
+    ('0.8.19', '>0.8.18', True),
+    ('0.8.18', '<=0.8.18', True),
+])
+def test_satisfies_pragma(version, pragma, expected):
+    assert analyze.satisfies_pragma(version, pragma) == expected
+
+def test_pragmas(tmp_path):
+    file = write(tmp_path / 'A.sol', 'pragma solidity ^0.8.0;\npragma   solidity >=0.6.0  <0.9.0;\ncontract A {}\n')
+
+    assert analyze.Analysis(str(tmp_path)).pragmas(file) == ['^0.8.0', '>=0.6.0  <0.9.0']
+
+def test_pragmas_ignore_comments(tmp_path):
+    source = '\n'.join([
+        '// pragma solidity ^0.4.0;',
+        '/* pragma solidity ^0.5.0;',
+        '   pragma solidity ^0.6.0; */',
+        'pragma solidity ^0.8.0; // pragma solidity ^0.7.0;',
+        'contract A { string url = "https://example.com/*"; }',
+        'contract B { string s = "// */"; } /* pragma solidity ^0.4.0; */',
+    ])
+    file = write(tmp_path / 'A.sol', source)
+
+    assert analyze.Analysis(str(tmp_path)).pragmas(file) == ['^0.8.0']
+
+def test_pragmas_of_missing_file(tmp_path):
+    assert analyze.Analysis(str(tmp_path)).pragmas(str(tmp_path / 'Missing.sol')) == []
+
+def test_pragmas_of_file_not_in_utf8(tmp_path):
+    file = tmp_path / 'A.sol'
+    file.write_bytes(b'// caf\xe9\npragma solidity ^0.8.0;\nimport "./B.sol";\ncontract A {}\n')
+
+    assert analyze.Analysis(str(tmp_path)).pragmas(str(file)) == ['^0.8.0']
+    assert analyze.Analysis(str(tmp_path)).imports(str(file)) == ['./B.sol']
+
+def test_strip_comments_keeps_strings():
+    assert analyze.strip_comments('a // b\nc /* d */ "// e" \'/* f */\'') == 'a  \nc   "// e" \'/* f */\''
+
+def test_root_files(tmp_path):
+    a = write(tmp_path / 'A.sol', 'import "./B.sol";\nimport "./sub/C.sol";\ncontract A {}\n')
+    write(tmp_path / 'B.sol', 'import "./sub/C.sol";\ncontract B {}\n')
+    write(tmp_path / 'sub' / 'C.sol', 'contract C {}\n')
+    d = write(tmp_path / 'D.sol', 'contract D {}\n')
+
+    assert analyze.Analysis(str(tmp_path)).root_files() == [a, d]
+
+def test_root_files_of_import_cycle(tmp_path):
+    a = write(tmp_path / 'A.sol', 'import "./B.sol";\ncontract A {}\n')
+    write(tmp_path / 'B.sol', 'import "./A.sol";\ncontract B {}\n')
+    c = write(tmp_path / 'C.sol', 'import "./D.sol";\ncontract C {}\n')
+    write(tmp_path / 'D.sol', 'import "./E.sol";\ncontract D {}\n')
+    write(tmp_path / 'E.sol', 'import "./D.sol";\ncontract E {}\n')
+
+    # every cycle is analyzed exactly once, from a single file
+    assert analyze.Analysis(str(tmp_path)).root_files() == [a, c]
+
+def test_root_files_of_subset(tmp_path):
+    write(tmp_path / 'A.sol', 'import "./B.sol";\ncontract A {}\n')
+    b = write(tmp_path / 'B.sol', 'import "./C.sol";\ncontract B {}\n')
+    c = write(tmp_path / 'C.sol', 'contract C {}\n')
+
+    # only imports among the given files count
+    assert analyze.Analysis(str(tmp_path)).root_files([b, c]) == [b]
+
+def test_root_files_with_dependencies(tmp_path):
+    a = write(tmp_path / 'contracts' / 'A.sol', 'import "lib/L.sol";\ncontract A {}\n')
+    write(tmp_path / 'deps' / 'lib' / 'L.sol', 'contract L {}\n')
+
+    assert analyze.Analysis(str(tmp_path / 'contracts'), str(tmp_path / 'deps')).root_files() == [a]
+
+# puts the stub slither, the fake solc and a solc-select without versions first on the path, returns the log of slither runs
+@pytest.fixture
+def stub_slither(tmp_path, monkeypatch):
+    bin = tmp_path / 'bin'
+    bin.mkdir()
+
+    (bin / 'slither').write_text(STUB_SLITHER.format(python=sys.executable))
+    (bin / 'solc-select').write_text('#! /bin/sh\nexit 1\n')
+    (bin / 'solc').symlink_to(FAKE_SOLC)
+
+    for stub in ['slither', 'solc-select']:
+        (bin / stub).chmod(0o755)
+
+    log = tmp_path / 'slither.log'
+    monkeypatch.setenv('PATH', f'{bin}{os.pathsep}{os.environ["PATH"]}')
+    monkeypatch.setenv('STUB_SLITHER_LOG', str(log))
+
+    return log
+
+def run_analyze(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, ANALYZE_PATH, *args], capture_output=True, text=True, timeout=300)
+
+def contract_info(contract: str, functions: int) -> str:
+    return '//@ ' + json.dumps({'detector': 'contract-info', 'contract': contract, 'functions': functions, 'public_functions': functions})
+
+def stored_statuses(path) -> dict[str, str]:
+    with sqlite3.connect(path) as connection:
+        return {os.path.basename(file): status for file, status in connection.execute('SELECT file, status FROM work_item_results')}
+
+def test_dead_worker(tmp_path, stub_slither):
+    # larger files are scheduled first, A is analyzed before B kills its worker
+    write(tmp_path / 'contracts' / 'A.sol', 'contract A {}\n' + contract_info('A', 2) + '\n' + '// padding\n' * 100)
+    write(tmp_path / 'contracts' / 'B.sol', 'contract B {}\n//! crash\n')
+    results = tmp_path / 'results.db'
+
+    process = run_analyze(str(tmp_path / 'contracts'), '--no-cache', '-j', '1', '--results-db', str(results))
+
+    assert process.returncode == 0, process.stderr
+    assert 'WARNING: Analysis of file' in process.stdout and 'BrokenProcessPool' in process.stdout
+    assert 'All functions: 2' in process.stdout
+    assert 'Failed: 1' in process.stdout
+    assert stored_statuses(results) == {'A.sol': 'succeeded', 'B.sol': 'failed'}
+
+def slither_runs(log) -> list[str]:
+    runs = [json.loads(line)[0] for line in log.read_text().splitlines()] if log.exists() else []
+    log.unlink(missing_ok=True)
+    return sorted(runs)
+
+def test_cache(tmp_path, stub_slither):
+    write(tmp_path / 'contracts' / 'A.sol', 'contract A {}\n' + contract_info('A', 2) + '\n')
+    b = write(tmp_path / 'contracts' / 'B.sol', 'contract B {}\n' + contract_info('B', 3) + '\n')
+    args = [str(tmp_path / 'contracts'), '--cache-dir', str(tmp_path / 'cache'), '-j', '2']
+
+    first = run_analyze(*args)
+    assert 'All functions: 5' in first.stdout
+    assert slither_runs(stub_slither) == ['A.sol', 'B.sol']
+
+    # nothing changed, every file is served from the cache
+    assert run_analyze(*args).stdout == first.stdout
+    assert slither_runs(stub_slither) == []
+
+    write(tmp_path / 'contracts' / 'B.sol', open(b).read().replace('3', '4'))
+
+    assert 'All functions: 6' in run_analyze(*args).stdout
+    assert slither_runs(stub_slither) == ['B.sol']
+
+def test_results_db_resume(tmp_path, stub_slither):
+    write(tmp_path / 'contracts' / 'A.sol', 'contract A {}\n' + contract_info('A', 2) + '\n')
+    write(tmp_path / 'contracts' / 'B.sol', 'contract B {}\n//! fail\n')
+    results = tmp_path / 'results.db'
+    args = [str(tmp_path / 'contracts'), '--no-cache', '--results-db', str(results)]
+
+    first = run_analyze(*args)
+    assert 'All functions: 2' in first.stdout and 'Failed: 1' in first.stdout
+    assert stored_statuses(results) == {'A.sol': 'succeeded', 'B.sol': 'failed'}
+    slither_runs(stub_slither)
+
+    # an interrupted run, only the work items missing from the store are run again
+    with sqlite3.connect(results) as connection:
+        connection.execute("DELETE FROM work_item_results WHERE file LIKE '%A.sol'")
+
+    assert run_analyze(*args, '--resume').stdout == first.stdout
+    assert slither_runs(stub_slither) == ['A.sol']
+    assert stored_statuses(results) == {'A.sol': 'succeeded', 'B.sol': 'failed'}
+
+    # the summary of the store alone
+    # the summary of the store alone is the summary of the run
+    assert run_analyze('--merge', str(results)).stdout == first.stdout
+
+def test_artifacts(tmp_path, stub_slither):
+    write(tmp_path / 'exports' / 'A_export.json', contract_info('A', 2) + '\n')
+    write(tmp_path / 'exports' / 'notes.json', contract_info('N', 100) + '\n')
+
+    with zipfile.ZipFile(tmp_path / 'exports' / 'exports.zip', 'w') as archive:
+        archive.writestr('B_export_archive.json', contract_info('B', 3) + '\n')
+        archive.writestr('README.md', contract_info('R', 100) + '\n')
+
+    process = run_analyze(str(tmp_path / 'exports'), '--artifacts', '--no-cache')
+
+    assert process.returncode == 0, process.stderr
+    assert 'All functions: 5' in process.stdout
+    # exports within the archive are extracted before they are passed to slither
+    assert slither_runs(stub_slither) == ['A_export.json', 'B_export_archive.json']
+
+def guard_check(function: str, unguarded: bool) -> str:
+    return '//@ ' + json.dumps({'detector': 'guard-check', 'contract': 'A', 'function': function, 'visibility': 'public', 'auth_guards': 0, 'state_guards': 0, 'input_guards': int(not unguarded), 'unguarded': unguarded})
+
+def test_diff(tmp_path, stub_slither):
+    repository = tmp_path / 'repository'
+
+    def commit(files: dict[str, str]):
+        for path, text in files.items():
+            write(repository / path, text)
+
+        subprocess.run(['git', '-C', str(repository), 'add', '-A'], check=True, capture_output=True)
+        subprocess.run(['git', '-C', str(repository), '-c', 'user.name=test', '-c', 'user.email=test@example.com', 'commit', '-m', 'change'], check=True, capture_output=True)
+
+    subprocess.run(['git', 'init', str(repository)], check=True, capture_output=True)
+    commit({
+        'contracts/A.sol': '\n'.join(['import "./L.sol";', 'contract A {}', guard_check('A.f()', False), guard_check('A.g()', True)]) + '\n',
+        'contracts/L.sol': 'contract L {}\n',
+        'contracts/U.sol': 'contract U {}\n',
+    })
+    commit({
+        'contracts/A.sol': '\n'.join(['import "./L.sol";', 'contract A {}', guard_check('A.f()', True), guard_check('A.g()', False)]) + '\n',
+        'contracts/L.sol': 'contract L { }\n',
+    })
+
+    process = run_analyze(str(repository / 'contracts'), '--diff', 'HEAD~1', 'HEAD')
+
+    assert process.returncode == 0, process.stderr
+    assert 'Changed files: 2\nAnalyzed files: 2\n' in process.stdout
+    assert 'Newly unguarded public functions:\n  contracts/A.sol: A.f()\n' in process.stdout
+    assert 'No longer unguarded public functions:\n  contracts/A.sol: A.g()\n' in process.stdout
+    # L.sol is analyzed through A.sol, the unchanged U.sol is not analyzed
+    assert slither_runs(stub_slither) == ['A.sol', 'A.sol']
@@ -0,0 +1,46 @@
+import os
+import pytest
+from slither import Slither
+from plugin.detectors.utils.contract_memo import get_contract_fingerprint
+
+FAKE_SOLC = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fake-solc')
+
+CONTRACT = '''pragma solidity ^0.8.0;
+
+function check(uint256 value) pure {
+    require(value > 0);
+}
+
+function forward(uint256 value) pure {
+    check(value);
+}
+
+contract Free {
+    function f(uint256 value) public pure {
+        forward(value);
+    }
+}
+
+contract Unrelated {
+    function g() public pure {}
+}
+'''
+
+def fingerprints(tmp_path, source: str) -> dict[str, str]:
+    path = tmp_path / 'Free.sol'
+    path.write_text(source)
+
+    slither = Slither(str(path), solc=FAKE_SOLC)
+
+    return {contract.name: get_contract_fingerprint(contract) for contract in slither.contracts}
+
+@pytest.mark.parametrize('change, changed', [
+    (('require(value > 0);', 'require(value > 1);'), {'Free'}),
+    (('check(value);', 'check(value + 1);'), {'Free'}),
+    (('pure {\n    require', 'pure {\n    // comment\n    require'), set()),
+])
+def test_fingerprint_covers_free_functions(tmp_path, change, changed):
+    before = fingerprints(tmp_path, CONTRACT)
+    after = fingerprints(tmp_path, CONTRACT.replace(*change))
+
+    assert {name for name in before if before[name] != after[name]} == changed
@@ -0,0 +1,116 @@
+import os
+import json
+import pytest
+from slither import Slither
+from plugin.detectors.guard_check_pattern import GuardCheckPattern
+from plugin.detectors.utils.analysis_index import CONDITION_BACKEND_ENV
+from plugin.detectors.utils.findings import FINDINGS_JSONL_ENV
+
+FAKE_SOLC = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fake-solc')
+
+HELPERS = '''
+    address internal owner;
+    uint256 internal total;
+
+    function positive(uint256 z) internal pure {
+        require(z > 0);
+    }
+
+    function sender(address a) internal view {
+        require(a == owner);
+    }
+'''
+
+# conditions both backends resolve the same way
+AGREEING = '''pragma solidity ^0.8.0;
+
+contract Calls {
+''' + HELPERS + '''
+    function constant() public pure {
+        positive(5);
+    }
+
+    function own(uint256 amount) public view {
+        require(amount > total);
+    }
+
+    function converted() public view {
+        require(msg.sender == address(this));
+    }
+}
+'''
+
+# the expression backend only resolves names in the function the require is evaluated in, it does not see what is passed to the parameters of callees
+THROUGH_PARAMETERS = '''pragma solidity ^0.8.0;
+
+contract Calls {
+''' + HELPERS + '''
+    function forward(uint256 y) internal pure {
+        positive(y);
+    }
+
+    function input(uint256 amount) public pure {
+        positive(amount);
+    }
+
+    function state() public view {
+        positive(total);
+    }
+
+    function auth() public view {
+        sender(msg.sender);
+    }
+
+    function chain(uint256 amount) public pure {
+        forward(amount);
+    }
+
+    function both(uint256 amount) public view {
+        forward(amount);
+        positive(total);
+    }
+}
+'''
+
+def guard_findings(monkeypatch, tmp_path, source: str, backend: str) -> list[dict]:
+    contract = tmp_path / 'Calls.sol'
+    contract.write_text(source)
+    sink = tmp_path / f'{backend}.jsonl'
+
+    monkeypatch.setenv(CONDITION_BACKEND_ENV, backend)
+    monkeypatch.setenv(FINDINGS_JSONL_ENV, str(sink))
+
+    slither = Slither(str(contract), solc=FAKE_SOLC)
+    slither.register_detector(GuardCheckPattern)
+    slither.run_detectors()
+
+    return [json.loads(line) for line in sink.read_text().splitlines()]
+
+def guards(findings: list[dict]) -> list[tuple]:
+    return [(finding['function'], finding['auth_guards'], finding['state_guards'], finding['input_guards']) for finding in findings]
+
+def test_backends_agree(monkeypatch, tmp_path):
+    ast = guard_findings(monkeypatch, tmp_path, AGREEING, 'ast')
+
+    assert guards(ast) == [
+        ('Calls.positive(uint256 z)', 0, 0, 1),
+        ('Calls.sender(address a)', 0, 1, 1),
+        # the parameter of positive is resolved to the constant passed to it
+        ('Calls.constant()', 0, 0, 0),
+        ('Calls.own(uint256 amount)', 0, 1, 1),
+        # type conversions are opaque to both backends
+        ('Calls.converted()', 1, 0, 0),
+    ]
+    assert guard_findings(monkeypatch, tmp_path, AGREEING, 'slithir') == ast
+
+def test_parameters_of_callees(monkeypatch, tmp_path):
+    assert guards(guard_findings(monkeypatch, tmp_path, THROUGH_PARAMETERS, 'slithir')) == [
+        ('Calls.positive(uint256 z)', 0, 0, 1),
+        ('Calls.sender(address a)', 0, 1, 1),
+        ('Calls.forward(uint256 y)', 0, 0, 1),
+        ('Calls.input(uint256 amount)', 0, 0, 1),
+        ('Calls.state()', 0, 1, 0),
+        ('Calls.auth()', 1, 1, 0),
+        ('Calls.chain(uint256 amount)', 0, 0, 1),
+        ('Calls.both(uint256 amount)', 0, 1, 1),
+    ]
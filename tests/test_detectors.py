@@ -0,0 +1,169 @@
+import os
+import json
+import sqlite3
+import pytest
+from slither import Slither
+from plugin import make_plugin
+from plugin.detectors.facade_pattern import FacadePattern
+from plugin.detectors.utils.analysis_index import CONDITION_BACKEND_ENV
+from plugin.detectors.utils.contract_memo import CONTRACT_MEMO_ENV
+from plugin.detectors.utils.findings import FINDINGS_JSONL_ENV
+from plugin.detectors.utils.pattern_detector import DETECT_JOBS_ENV
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+FAKE_SOLC = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fake-solc')
+
+# precompiled from Patterns.sol with tests/fake-solc, rebuild it from the root of the repository after changing the contract:
+#     python3 -c "import json; from benchmarks.build_fixtures import standard_export; json.dump(standard_export('tests/fixtures', 'Patterns.sol', '$PWD/tests/fake-solc'), open('tests/fixtures/patterns_export.json', 'w'))"
+PATTERNS_EXPORT = 'patterns_export.json'
+
+def guard_finding(contract: str, function: str, visibility: str, auth: int, state: int, input: int, unguarded: bool) -> dict:
+    return {'contract': contract, 'file': 'Patterns.sol', 'function': function, 'visibility': visibility, 'auth_guards': auth, 'state_guards': state, 'input_guards': input, 'unguarded': unguarded}
+
+EXPECTED_FINDINGS = {
+    'contract-info': [
+        {'contract': 'Oracle', 'file': 'Patterns.sol', 'functions': 2, 'public_functions': 2},
+        {'contract': 'Owned', 'file': 'Patterns.sol', 'functions': 0, 'public_functions': 0},
+        {'contract': 'Vault', 'file': 'Patterns.sol', 'functions': 6, 'public_functions': 6},
+    ],
+    'emergency-stop': [
+        {'contract': 'Vault', 'file': 'Patterns.sol', 'modifier': 'whenNotStopped', 'state_variable': 'stopped', 'unstoppable_functions': ['Vault.stop()', 'Vault.sync()', 'Vault.callback(uint256 value)'], 'stoppable_functions': ['Vault.deposit(uint256 amount)', 'Vault.withdraw(uint256 amount)', 'Vault.refresh(uint256 id)']},
+    ],
+    'facade': [
+        {'contract': 'Vault', 'file': 'Patterns.sol', 'function': 'Vault.refresh(uint256 id)', 'visibility': 'public', 'warning': True},
+    ],
+    'guard-check': [
+        guard_finding('Oracle', 'Oracle.price(uint256 id)', 'external', 0, 0, 0, True),
+        guard_finding('Oracle', 'Oracle.request(uint256 id)', 'external', 0, 0, 0, True),
+        guard_finding('Vault', 'Vault.stop()', 'public', 1, 1, 0, False),
+        guard_finding('Vault', 'Vault.deposit(uint256 amount)', 'public', 0, 1, 1, False),
+        guard_finding('Vault', 'Vault.withdraw(uint256 amount)', 'public', 1, 3, 1, False),
+        guard_finding('Vault', 'Vault.refresh(uint256 id)', 'public', 0, 1, 0, False),
+        guard_finding('Vault', 'Vault.sync()', 'public', 0, 0, 0, True),
+        guard_finding('Vault', 'Vault.callback(uint256 value)', 'public', 1, 0, 0, False),
+    ],
+    'oracle': [
+        {'contract': 'Vault', 'file': 'Patterns.sol', 'oracle_contract': 'Oracle', 'oracle_variable': 'oracle', 'callback': 'Vault.callback(uint256 value)'},
+    ],
+}
+
+def load_patterns(monkeypatch) -> Slither:
+    # the export references its source relative to the fixtures directory
+    with monkeypatch.context() as m:
+        m.chdir(FIXTURES_DIR)
+        slither = Slither(PATTERNS_EXPORT)
+
+    for detector in make_plugin()[0]:
+        slither.register_detector(detector)
+
+    return slither
+
+# runs all plugin detectors with the findings sink and returns detector -> findings
+def detect(monkeypatch, tmp_path, **env) -> dict[str, list[dict]]:
+    sink = tmp_path / 'findings.jsonl'
+    sink.unlink(missing_ok=True)
+
+    monkeypatch.setenv(FINDINGS_JSONL_ENV, str(sink))
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+
+    # findings go to the sink only
+    assert not any(load_patterns(monkeypatch).run_detectors())
+
+    findings = {}
+    for line in sink.read_text().splitlines():
+        finding = json.loads(line)
+        findings.setdefault(finding.pop('detector'), []).append(finding)
+
+    return findings
+
+def test_text_results(monkeypatch):
+    monkeypatch.delenv(FINDINGS_JSONL_ENV, raising=False)
+
+    results = [result for detector_results in load_patterns(monkeypatch).run_detectors() for result in detector_results]
+    descriptions = {}
+    for result in results:
+        descriptions.setdefault(result['check'], []).append(result['description'])
+
+    # findings are only part of the text, the structured findings are written to the sink
+    assert not any('additional_fields' in result for result in results)
+
+    # one result per contract with findings
+    assert {check: len(texts) for check, texts in descriptions.items()} == {'contract-info': 3, 'emergency-stop': 1, 'facade': 1, 'guard-check': 2, 'oracle': 1}
+    assert 'DETECTOR WARNING: No Guard Patterns detected in public function Vault.sync().' in ''.join(descriptions['guard-check'])
+    assert 'DETECTOR WARNING: Chained external calls detected in public function Vault.refresh(uint256 id).' in descriptions['facade'][0]
+    assert 'Callback function: Vault.callback(uint256 value)' in descriptions['oracle'][0]
+    assert 'not guarded by emergency stop modifier: Vault.stop(), Vault.sync(), Vault.callback(uint256 value)' in descriptions['emergency-stop'][0]
+
+@pytest.mark.parametrize('env', [
+    {},
+    {CONDITION_BACKEND_ENV: 'slithir'},
+    {DETECT_JOBS_ENV: '2'},
+    {DETECT_JOBS_ENV: '2', CONDITION_BACKEND_ENV: 'slithir'},
+], ids=['ast', 'slithir', 'parallel', 'parallel-slithir'])
+def test_findings(monkeypatch, tmp_path, env):
+    assert detect(monkeypatch, tmp_path, **env) == EXPECTED_FINDINGS
+
+def test_findings_with_contract_memo(monkeypatch, tmp_path):
+    memo = str(tmp_path / 'memo.db')
+
+    assert detect(monkeypatch, tmp_path, **{CONTRACT_MEMO_ENV: memo}) == EXPECTED_FINDINGS
+
+    with sqlite3.connect(memo) as connection:
+        # every detector memoized every contract it analyzed
+        assert connection.execute('SELECT detector, COUNT(*) FROM memoized_findings GROUP BY detector').fetchall() == [(detector, 3) for detector in sorted(EXPECTED_FINDINGS)]
+        connection.execute("UPDATE memoized_findings SET findings = '[]' WHERE detector = 'facade'")
+
+    # the second run is served from the memo
+    assert detect(monkeypatch, tmp_path, **{CONTRACT_MEMO_ENV: memo}) == {detector: findings for detector, findings in EXPECTED_FINDINGS.items() if detector != 'facade'}
+
+    # the memo of one condition backend is not served to the other
+    assert detect(monkeypatch, tmp_path, **{CONTRACT_MEMO_ENV: memo, CONDITION_BACKEND_ENV: 'slithir'}) == EXPECTED_FINDINGS
+
+FACADE_CONTRACT = '''pragma solidity ^0.8.0;
+
+contract Feed {
+    function ready() external returns (bool) {
+        return true;
+    }
+
+    function price() external returns (uint256) {
+        return 1;
+    }
+}
+
+contract Consumer {
+    Feed feed;
+    uint256 last;
+
+    function assigned() public {
+        last = feed.price();
+        last = feed.price();
+    }
+
+    function required() public {
+        require(feed.ready());
+        feed.price();
+    }
+
+    function nested() public {
+        last = feed.price() + feed.price();
+    }
+
+    function single() public {
+        require(feed.ready());
+    }
+}
+'''
+
+def test_facade_calls_within_expressions(monkeypatch, tmp_path):
+    contract = tmp_path / 'Consumer.sol'
+    contract.write_text(FACADE_CONTRACT)
+    sink = tmp_path / 'findings.jsonl'
+    monkeypatch.setenv(FINDINGS_JSONL_ENV, str(sink))
+
+    slither = Slither(str(contract), solc=FAKE_SOLC)
+    slither.register_detector(FacadePattern)
+    slither.run_detectors()
+
+    assert [json.loads(line)['function'] for line in sink.read_text().splitlines()] == ['Consumer.assigned()', 'Consumer.required()', 'Consumer.nested()']
@@ -0,0 +1,39 @@
+import os
+import sys
+import glob
+import json
+import subprocess
+from plugin.detectors.utils.pattern_detector import DETECT_JOBS_ENV
+from plugin.detectors.utils.profiling import PROFILE_ENV
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# profiling is decided when the plugin is imported, so slither runs in a process of its own. It exits with an error code since there are results
+def profile(tmp_path, **env) -> tuple[dict, dict]:
+    directory = tmp_path / 'profile'
+    subprocess.run([sys.executable, '-m', 'slither', 'patterns_export.json'], cwd=FIXTURES_DIR, env={**os.environ, PROFILE_ENV: str(directory), **env}, capture_output=True)
+
+    # workers do not write profiles of their own
+    report, = glob.glob(str(directory / 'profile-*[0-9].json'))
+    speedscope, = glob.glob(str(directory / 'profile-*.speedscope.json'))
+
+    with open(report) as f, open(speedscope) as g:
+        return json.load(f), json.load(g)
+
+def contract_spans(report: dict) -> dict[str, int]:
+    return {name: span['calls'] for name, span in report['spans'].items() if name.startswith('contract:')}
+
+def test_parallel_profile_covers_workers(tmp_path):
+    sequential, _ = profile(tmp_path / 'sequential')
+    parallel, speedscope = profile(tmp_path / 'parallel', **{DETECT_JOBS_ENV: '2'})
+
+    # every detector analyzed every contract once, in the workers
+    assert len(contract_spans(parallel)) == 15
+    assert contract_spans(parallel) == contract_spans(sequential)
+    assert parallel['spans']['detect_in_parallel']['calls'] == 1
+    # the parent itself does not visit any condition
+    assert parallel['counters']['deep_condition:visits'] > 0
+
+    frames = [frame['name'] for frame in speedscope['shared']['frames']]
+    sampled = {frames[frame] for stack in speedscope['profiles'][0]['samples'] for frame in stack}
+    assert set(contract_spans(parallel)) <= sampled
@@ -0,0 +1,112 @@
+import os
+import sys
+import json
+import time
+import socket
+import subprocess
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FAKE_SOLC = os.path.join(ROOT, 'tests', 'fake-solc')
+
+CONTRACT = '''pragma solidity ^0.8.0;
+
+contract Owned {
+    address internal owner;
+
+    constructor() {
+        owner = msg.sender;
+    }
+
+    function set(uint256 value) public {
+        require(msg.sender == owner);
+        require(value > 0);
+    }
+}
+'''
+
+def start_server(*args) -> subprocess.Popen:
+    return subprocess.Popen([sys.executable, '-m', 'plugin.server', *args], cwd=ROOT, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+
+# answers every job on stdin, in order
+def run_stdin_jobs(lines: list[str]) -> list[dict]:
+    server = start_server()
+    stdout, _ = server.communicate('\n'.join(lines) + '\n', timeout=300)
+
+    return [json.loads(line) for line in stdout.splitlines()]
+
+@pytest.fixture
+def contract(tmp_path):
+    path = tmp_path / 'Owned.sol'
+    path.write_text(CONTRACT)
+    return str(path)
+
+@pytest.fixture
+def slow_solc(tmp_path):
+    path = tmp_path / 'slow-solc'
+    path.write_text(f'#! /bin/sh\ncase "$*" in *--version*) ;; *) sleep 30 ;; esac\nexec "{FAKE_SOLC}" "$@"\n')
+    path.chmod(0o755)
+    return str(path)
+
+def test_stdin_job(contract):
+    response, = run_stdin_jobs([json.dumps({'id': 1, 'target': contract, 'detectors': ['guard-check'], 'solc': FAKE_SOLC})])
+
+    assert response['id'] == 1
+    assert response['status'] == 'succeeded'
+    assert response['error'] is None
+    assert [(finding['function'], finding['auth_guards'], finding['input_guards']) for finding in response['findings']] == [('Owned.set(uint256 value)', 1, 1)]
+
+def test_stdin_job_failures(contract, slow_solc):
+    responses = run_stdin_jobs([
+        '{"id": 1, "target": ',
+        json.dumps(['not', 'a', 'job']),
+        json.dumps({'id': 3, 'target': contract, 'detectors': ['no-such-detector'], 'solc': FAKE_SOLC}),
+        json.dumps({'id': 4, 'target': contract, 'solc': slow_solc, 'timeout': 1}),
+        json.dumps({'id': 5, 'target': str(contract) + '.missing.sol', 'solc': FAKE_SOLC}),
+        # the server keeps answering after failed jobs
+        json.dumps({'id': 6, 'target': contract, 'detectors': ['contract-info'], 'solc': FAKE_SOLC}),
+    ])
+
+    assert [(response['id'], response['status']) for response in responses] == [(None, 'failed'), (None, 'failed'), (3, 'failed'), (4, 'timeout'), (5, 'failed'), (6, 'succeeded')]
+    assert responses[0]['error'].startswith('Invalid job')
+    assert responses[1]['error'].startswith('Invalid job')
+    assert 'no-such-detector' in responses[2]['error']
+    assert responses[3]['findings'] == []
+    assert responses[5]['findings'][0]['contract'] == 'Owned'
+
+def test_socket_jobs(tmp_path, contract, slow_solc):
+    socket_path = str(tmp_path / 'sdp.sock')
+    server = start_server('--socket', socket_path)
+
+    try:
+        deadline = time.monotonic() + 60
+        while not os.path.exists(socket_path):
+            assert server.poll() is None and time.monotonic() < deadline
+            time.sleep(0.1)
+
+        def connect():
+            client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            client.connect(socket_path)
+            return client, client.makefile('rw')
+
+        # connections are handled in parallel, the slow job does not hold up the others
+        slow_client, slow = connect()
+        slow.write(json.dumps({'id': 1, 'target': contract, 'solc': slow_solc, 'timeout': 2}) + '\n')
+        slow.flush()
+
+        client, f = connect()
+        for job in ['{"id": 2', json.dumps({'id': 3, 'target': contract, 'detectors': ['no-such-detector'], 'solc': FAKE_SOLC}), json.dumps({'id': 4, 'target': contract, 'detectors': ['guard-check'], 'solc': FAKE_SOLC})]:
+            f.write(job + '\n')
+        f.flush()
+
+        responses = [json.loads(f.readline()) for _ in range(3)]
+        assert [(response['id'], response['status']) for response in responses] == [(None, 'failed'), (3, 'failed'), (4, 'succeeded')]
+        assert responses[2]['findings'][0]['function'] == 'Owned.set(uint256 value)'
+
+        assert json.loads(slow.readline())['status'] == 'timeout'
+
+        client.close()
+        slow_client.close()
+    finally:
+        server.terminate()
+        server.wait(timeout=60)